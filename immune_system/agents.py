@@ -4,11 +4,15 @@ Agent Runtime - Core agent implementation with state and execution logic
 import asyncio
 import hashlib
 import random
+import sys
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List
+from enum import Enum, IntEnum
+from itertools import cycle, islice
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 import time
 
+from .telemetry import AgentVitals
+
 # Approximate cost per 1K tokens by model (USD)
 MODEL_COST_PER_1K = {
     "GPT-5": 0.03,
@@ -32,7 +36,67 @@ class AgentStatus(Enum):
     INFECTED = "infected"
 
 
-@dataclass
+class InfectionType(IntEnum):
+    """Simulated infection kinds.  The ordinal indexes ``_INFECTION_PROFILES``."""
+    NONE = 0
+    TOKEN_EXPLOSION = 1
+    TOOL_LOOP = 2
+    LATENCY_SPIKE = 3
+    HIGH_RETRY_RATE = 4
+    PROMPT_DRIFT = 5
+    MEMORY_CORRUPTION = 6
+    FULL_MELTDOWN = 7
+    PROMPT_INJECTION = 8
+
+
+class _InfectionProfile(NamedTuple):
+    """How an infection distorts each vital.
+
+    Multiplier ranges are inclusive ``(low, high)`` factors applied to the
+    agent's baseline; ``None`` leaves that vital at its baseline.
+    """
+    latency: Optional[Tuple[int, int]] = None
+    input_tokens: Optional[Tuple[int, int]] = None
+    output_tokens: Optional[Tuple[int, int]] = None
+    tool_calls: Optional[Tuple[int, int]] = None
+    retry_threshold: float = 0.9
+    error_threshold: float = 1.0
+    error_types: Tuple[str, ...] = ()
+    corrupts_prompt: bool = False
+
+
+# Indexed by InfectionType; unknown infection names fall back to NONE, which
+# marks the agent infected without distorting any vital.
+_INFECTION_PROFILES: Tuple[_InfectionProfile, ...] = (
+    _InfectionProfile(),                                              # NONE
+    _InfectionProfile(input_tokens=(5, 10), output_tokens=(5, 12)),   # TOKEN_EXPLOSION
+    _InfectionProfile(tool_calls=(5, 11)),                            # TOOL_LOOP
+    _InfectionProfile(latency=(3, 7)),                                # LATENCY_SPIKE
+    _InfectionProfile(retry_threshold=0.25, error_threshold=0.4,      # HIGH_RETRY_RATE
+                      error_types=("rate_limit", "timeout", "")),
+    _InfectionProfile(latency=(3, 6), input_tokens=(3, 6),            # PROMPT_DRIFT
+                      output_tokens=(4, 8), corrupts_prompt=True),
+    _InfectionProfile(latency=(3, 6), retry_threshold=0.3,            # MEMORY_CORRUPTION
+                      error_threshold=0.6, error_types=("content_filter",)),
+    _InfectionProfile(latency=(3, 6), input_tokens=(3, 6),            # FULL_MELTDOWN
+                      output_tokens=(5, 12), tool_calls=(5, 10)),
+    _InfectionProfile(input_tokens=(5, 10), corrupts_prompt=True),    # PROMPT_INJECTION
+)
+
+_INFECTION_TYPE_IDS: Dict[str, InfectionType] = {t.name.lower(): t for t in InfectionType if t}
+
+
+def _intern(value):
+    """Intern plain strings; anything else (e.g. a JSON null/number from the
+    ingest API, or a str subclass) is kept as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# slots=True needs Python 3.10+; the server/gateway images still run 3.9.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentState:
     """Agent's internal state"""
     memory: Dict = field(default_factory=dict)
@@ -68,20 +132,50 @@ class AgentState:
 
 class BaseAgent:
     """Base agent class with telemetry emission"""
+
+    # Fixed attribute layout: no per-instance __dict__ for pools of many agents.
+    __slots__ = (
+        "agent_id", "agent_type", "_model_name", "_cost_rate", "mcp_servers", "state",
+        "status", "execution_count", "_rng", "_uniform", "_randint", "_random",
+        "base_latency_ms", "base_tokens", "base_tool_calls", "_prompt_hash",
+        "infected", "infection_type", "infection_type_id",
+    )
+
+    # Inclusive ranges the baseline characteristics are drawn from when not
+    # given explicitly; subclasses override them per agent type.
+    LATENCY_RANGE_MS = (200, 400)
+    TOKENS_RANGE = (1000, 1500)
+    TOOL_CALLS_RANGE = (2, 4)
     
-    def __init__(self, agent_id: str, agent_type: str, model_name: str = "GPT-4", mcp_servers: List[str] = None):
+    def __init__(self, agent_id: str, agent_type: str, model_name: str = "GPT-4", mcp_servers: List[str] = None,
+                 base_latency_ms: Optional[int] = None, base_tokens: Optional[int] = None,
+                 base_tool_calls: Optional[int] = None):
         self.agent_id = agent_id
-        self.agent_type = agent_type
+        self.agent_type = _intern(agent_type)
         self.model_name = model_name
         self.mcp_servers = mcp_servers or []
         self.state = AgentState()
         self.status = AgentStatus.HEALTHY
         self.execution_count = 0
+
+        # Per-agent generator with its hot methods pre-bound: avoids the module
+        # attribute lookups on every draw and keeps agents off the shared
+        # global RNG state.
+        self._rng = random.Random()
+        self._uniform = self._rng.uniform
+        self._randint = self._rng.randint
+        self._random = self._rng.random
         
         # Baseline behavioral characteristics (varies by agent type)
-        self.base_latency_ms = random.randint(200, 400)
-        self.base_tokens = random.randint(1000, 1500)
-        self.base_tool_calls = random.randint(2, 4)
+        if base_latency_ms is None:
+            base_latency_ms = self._randint(*self.LATENCY_RANGE_MS)
+        if base_tokens is None:
+            base_tokens = self._randint(*self.TOKENS_RANGE)
+        if base_tool_calls is None:
+            base_tool_calls = self._randint(*self.TOOL_CALLS_RANGE)
+        self.base_latency_ms = base_latency_ms
+        self.base_tokens = base_tokens
+        self.base_tool_calls = base_tool_calls
         
         # Stable prompt hash per agent (changes on prompt_drift infection)
         self._prompt_hash = hashlib.sha256(f"system-prompt-v1-{agent_id}".encode()).hexdigest()[:16]
@@ -89,121 +183,149 @@ class BaseAgent:
         # Infection state
         self.infected = False
         self.infection_type = None
+        self.infection_type_id = InfectionType.NONE
     
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @model_name.setter
+    def model_name(self, value: str):
+        # Per-1K-token price, resolved on assignment instead of on every
+        # execution; reassigning model_name keeps it in sync.
+        self._model_name = value
+        self._cost_rate = MODEL_COST_PER_1K.get(value, 0.005)
+
     def _estimate_cost(self, total_tokens: int) -> float:
-        rate = MODEL_COST_PER_1K.get(self.model_name, 0.005)
-        return round(total_tokens * rate / 1000.0, 6)
+        return round(total_tokens * self._cost_rate / 1000.0, 6)
 
-    async def execute(self) -> Dict:
-        """Execute agent task and return telemetry"""
-        start_time = time.time()
-        
-        await asyncio.sleep(random.uniform(0.1, 0.3))
-        
-        variance = random.uniform(0.8, 1.2)
-        
-        if self.infected:
-            latency_ms = self._infected_latency()
-            input_tokens = self._infected_input_tokens()
-            output_tokens = self._infected_output_tokens()
-            tool_calls = self._infected_tool_calls()
-            retries = self._infected_retries()
-            error_type = self._infected_error_type()
-            prompt_hash = self._infected_prompt_hash()
-        else:
-            total = int(self.base_tokens * variance)
-            input_tokens = int(total * random.uniform(0.55, 0.75))
-            output_tokens = total - input_tokens
-            latency_ms = int(self.base_latency_ms * variance)
-            tool_calls = max(1, int(self.base_tool_calls * variance))
-            retries = 1 if random.random() > 0.9 else 0
-            error_type = ""
-            prompt_hash = self._prompt_hash
-
-        token_count = input_tokens + output_tokens
-        success = error_type == "" and random.random() > 0.05
-        
-        self.execution_count += 1
-        elapsed_ms = int((time.time() - start_time) * 1000)
-        
-        return {
-            'agent_id': self.agent_id,
-            'agent_type': self.agent_type,
-            'latency_ms': max(elapsed_ms, latency_ms),
-            'token_count': token_count,
-            'input_tokens': input_tokens,
-            'output_tokens': output_tokens,
-            'cost': self._estimate_cost(token_count),
-            'tool_calls': tool_calls,
-            'retries': retries,
-            'success': success,
-            'model': self.model_name,
-            'error_type': error_type,
-            'prompt_hash': prompt_hash,
-            'timestamp': time.time(),
-        }
-    
-    def _infected_latency(self) -> int:
-        if self.infection_type == "latency_spike":
-            return self.base_latency_ms * random.randint(3, 7)
-        if self.infection_type in ("prompt_drift", "memory_corruption", "full_meltdown"):
-            return self.base_latency_ms * random.randint(3, 6)
-        return self.base_latency_ms
+    async def execute(self) -> AgentVitals:
+        """Execute agent task and return telemetry.
+
+        The work is simulated, so nothing is awaited here: latency is computed
+        arithmetically and pacing is left to the caller's tick loop.
+        """
+        return self._compute_telemetry()
+
+    def _compute_telemetry(self) -> AgentVitals:
+        """Synchronously compute one execution's telemetry (pure CPU)."""
+        return self.execute_batch((self,))[0]
+
+    @classmethod
+    def execute_batch(cls, agents: Sequence["BaseAgent"]) -> List[AgentVitals]:
+        """Produce one tick of telemetry for every agent in a single synchronous pass.
+
+        The clock is read once per batch, each agent draws from its own
+        pre-bound generator methods, and no agent yields to the event loop, so
+        an N-agent tick costs one call instead of N awaits.  Rows are built
+        directly as AgentVitals so telemetry and the baseline learner can use
+        them as-is.
+        """
+        now = time.time()
+        out = []
+        append = out.append
+        vitals_cls = AgentVitals
+
+        for agent in agents:
+            rand = agent._random
+
+            if agent.infected:
+                (latency_ms, input_tokens, output_tokens, tool_calls,
+                 retries, error_type, prompt_hash) = agent._infected_vitals()
+                success = error_type == "" and rand() > 0.05
+            else:
+                # Healthy fast path (the common case).  uniform(a, b) is a
+                # Python-level wrapper around a + (b - a) * random(), so the
+                # bound C random() is used directly; int(...) or 1 replaces a
+                # max() call since the product is never negative.
+                variance = 0.8 + 0.4 * rand()
+                total = int(agent.base_tokens * variance)
+                input_tokens = int(total * (0.55 + 0.2 * rand()))
+                output_tokens = total - input_tokens
+                latency_ms = int(agent.base_latency_ms * variance)
+                tool_calls = int(agent.base_tool_calls * variance) or 1
+                retries = 1 if rand() > 0.9 else 0
+                error_type = ""
+                prompt_hash = agent._prompt_hash
+                success = rand() > 0.05
+
+            token_count = input_tokens + output_tokens
+            agent.execution_count += 1
+
+            append(vitals_cls(
+                timestamp=now,
+                agent_id=agent.agent_id,
+                agent_type=agent.agent_type,
+                latency_ms=latency_ms,
+                token_count=token_count,
+                tool_calls=tool_calls,
+                retries=retries,
+                success=success,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost=agent._estimate_cost(token_count),
+                model=agent._model_name,
+                error_type=error_type,
+                prompt_hash=prompt_hash,
+            ))
+
+        return out
     
-    def _infected_input_tokens(self) -> int:
-        """Input token inflation (prompt injection / context stuffing)."""
+    def _infected_vitals(self) -> Tuple[int, int, int, int, int, str, str]:
+        """Vitals for an infected execution, driven by the infection's profile.
+
+        Returns (latency_ms, input_tokens, output_tokens, tool_calls, retries,
+        error_type, prompt_hash).
+        """
+        profile = _INFECTION_PROFILES[self.infection_type_id]
+        randint = self._randint
+        rand = self._random
+
         base_input = int(self.base_tokens * 0.65)
-        if self.infection_type in ("prompt_injection", "token_explosion"):
-            return base_input * random.randint(5, 10)
-        if self.infection_type in ("prompt_drift", "full_meltdown"):
-            return base_input * random.randint(3, 6)
-        return int(base_input * random.uniform(0.8, 1.2))
-
-    def _infected_output_tokens(self) -> int:
-        """Output token inflation (runaway generation)."""
         base_output = int(self.base_tokens * 0.35)
-        if self.infection_type in ("token_explosion", "full_meltdown"):
-            return base_output * random.randint(5, 12)
-        if self.infection_type == "prompt_drift":
-            return base_output * random.randint(4, 8)
-        return int(base_output * random.uniform(0.8, 1.2))
-    
-    def _infected_tool_calls(self) -> int:
-        if self.infection_type == "tool_loop":
-            return self.base_tool_calls * random.randint(5, 11)
-        if self.infection_type == "full_meltdown":
-            return self.base_tool_calls * random.randint(5, 10)
-        return self.base_tool_calls
-    
-    def _infected_retries(self) -> int:
-        if self.infection_type == "high_retry_rate":
-            return 1 if random.random() > 0.25 else 0
-        if self.infection_type == "memory_corruption":
-            return 1 if random.random() > 0.3 else 0
-        return 1 if random.random() > 0.9 else 0
-
-    def _infected_error_type(self) -> str:
-        if self.infection_type == "high_retry_rate":
-            return random.choice(["rate_limit", "timeout", ""]) if random.random() > 0.4 else ""
-        if self.infection_type == "memory_corruption":
-            return "content_filter" if random.random() > 0.6 else ""
-        return ""
-
-    def _infected_prompt_hash(self) -> str:
-        if self.infection_type in ("prompt_drift", "prompt_injection"):
-            return hashlib.sha256(f"corrupted-{time.time()}".encode()).hexdigest()[:16]
-        return self._prompt_hash
+
+        latency_ms = self.base_latency_ms
+        if profile.latency:
+            latency_ms *= randint(*profile.latency)
+        if profile.input_tokens:
+            input_tokens = base_input * randint(*profile.input_tokens)
+        else:
+            input_tokens = int(base_input * self._uniform(0.8, 1.2))
+        if profile.output_tokens:
+            output_tokens = base_output * randint(*profile.output_tokens)
+        else:
+            output_tokens = int(base_output * self._uniform(0.8, 1.2))
+        tool_calls = self.base_tool_calls
+        if profile.tool_calls:
+            tool_calls *= randint(*profile.tool_calls)
+
+        retries = 1 if rand() > profile.retry_threshold else 0
+        error_type = ""
+        if profile.error_types and rand() > profile.error_threshold:
+            error_type = self._rng.choice(profile.error_types)
+
+        prompt_hash = self._prompt_hash
+        if profile.corrupts_prompt:
+            prompt_hash = hashlib.sha256(f"corrupted-{time.time()}".encode()).hexdigest()[:16]
+
+        return latency_ms, input_tokens, output_tokens, tool_calls, retries, error_type, prompt_hash
     
-    def infect(self, infection_type: str):
+    def infect(self, infection_type: Union[str, InfectionType]):
         """Infect the agent with specific problem"""
+        if isinstance(infection_type, InfectionType):
+            self.infection_type_id = infection_type
+            infection_type = infection_type.name.lower()
+        else:
+            self.infection_type_id = _INFECTION_TYPE_IDS.get(infection_type, InfectionType.NONE)
         self.infected = True
-        self.infection_type = infection_type
+        self.infection_type = _intern(infection_type)
         self.status = AgentStatus.INFECTED
     
     def cure(self):
         """Cure the agent"""
         self.infected = False
         self.infection_type = None
+        self.infection_type_id = InfectionType.NONE
         self.status = AgentStatus.HEALTHY
     
     def quarantine(self):
@@ -221,38 +343,48 @@ class BaseAgent:
 
 class ResearchAgent(BaseAgent):
     """Agent that does research tasks"""
-    def __init__(self, agent_id: str):
-        super().__init__(agent_id, "Research")
-        self.base_tokens = random.randint(1200, 1600)
-        self.base_tool_calls = random.randint(3, 5)
+    __slots__ = ()
+    TOKENS_RANGE = (1200, 1600)
+    TOOL_CALLS_RANGE = (3, 5)
+
+    def __init__(self, agent_id: str, **kwargs):
+        super().__init__(agent_id, "Research", **kwargs)
 
 
 class DataAgent(BaseAgent):
     """Agent that processes data"""
-    def __init__(self, agent_id: str):
-        super().__init__(agent_id, "Data")
-        self.base_latency_ms = random.randint(150, 300)
-        self.base_tokens = random.randint(800, 1200)
+    __slots__ = ()
+    LATENCY_RANGE_MS = (150, 300)
+    TOKENS_RANGE = (800, 1200)
+
+    def __init__(self, agent_id: str, **kwargs):
+        super().__init__(agent_id, "Data", **kwargs)
 
 
 class AnalyticsAgent(BaseAgent):
     """Agent that performs analytics"""
-    def __init__(self, agent_id: str):
-        super().__init__(agent_id, "Analytics")
-        self.base_latency_ms = random.randint(300, 500)
-        self.base_tool_calls = random.randint(4, 6)
+    __slots__ = ()
+    LATENCY_RANGE_MS = (300, 500)
+    TOOL_CALLS_RANGE = (4, 6)
+
+    def __init__(self, agent_id: str, **kwargs):
+        super().__init__(agent_id, "Analytics", **kwargs)
 
 
 class CoordinatorAgent(BaseAgent):
     """Agent that coordinates other agents"""
-    def __init__(self, agent_id: str):
-        super().__init__(agent_id, "Coordinator")
-        self.base_tokens = random.randint(1000, 1400)
-        self.base_tool_calls = random.randint(5, 8)
+    __slots__ = ()
+    TOKENS_RANGE = (1000, 1400)
+    TOOL_CALLS_RANGE = (5, 8)
+
+    def __init__(self, agent_id: str, **kwargs):
+        super().__init__(agent_id, "Coordinator", **kwargs)
 
 
+# Read-only presets, frozen as tuples of interned strings so ids and labels
+# handed to agents compare by identity first.
 # Real-world AI agent names (VPN, Docker, Slack, DB, network, etc.)
-AGENT_NAMES = [
+AGENT_NAMES = tuple(map(sys.intern, (
     "VPN",
     "Docker",
     "Slack",
@@ -268,31 +400,68 @@ AGENT_NAMES = [
     "Linear",
     "SendGrid",
     "Brave Search",
-]
+)))
 
 # Example models and MCP servers for dashboard display (hackathon realism)
-MODELS = ["GPT-5", "Claude Sonnet 4", "Claude Opus 4", "Gemini 2.0", "GPT-4o", "Claude Sonnet 3.5"]
-MCP_SERVER_PRESETS = [
-    ["filesystem", "github", "slack"],
-    ["postgres", "web-fetch", "notion"],
-    ["google-drive", "figma", "linear"],
-    ["brave-search", "fetch", "memory"],
-    ["filesystem", "postgres", "sendgrid"],
-    ["github", "slack", "notion"],
-]
-
-
-def create_agent_pool(count: int) -> List[BaseAgent]:
-    """Create a pool of diverse agents with real-world names and model/MCP labels"""
+MODELS = tuple(map(sys.intern, (
+    "GPT-5", "Claude Sonnet 4", "Claude Opus 4", "Gemini 2.0", "GPT-4o", "Claude Sonnet 3.5",
+)))
+MCP_SERVER_PRESETS = tuple(tuple(map(sys.intern, preset)) for preset in (
+    ("filesystem", "github", "slack"),
+    ("postgres", "web-fetch", "notion"),
+    ("google-drive", "figma", "linear"),
+    ("brave-search", "fetch", "memory"),
+    ("filesystem", "postgres", "sendgrid"),
+    ("github", "slack", "notion"),
+))
+
+
+async def execute_all(agents: Sequence[BaseAgent]) -> List[AgentVitals]:
+    """Run one execution for every agent; returns telemetry in input order.
+
+    Agents on the built-in simulated execute() never suspend, so they are
+    computed in a single execute_batch() pass without creating any Tasks.
+    Only agents whose class overrides execute() (e.g. with real I/O) are
+    awaited, together in one gather().
+    """
+    out: List[Optional[AgentVitals]] = [None] * len(agents)
+    simulated: List[int] = []
+    custom: List[int] = []
+    for i, agent in enumerate(agents):
+        (simulated if type(agent).execute is BaseAgent.execute else custom).append(i)
+
+    if simulated:
+        batch = BaseAgent.execute_batch([agents[i] for i in simulated])
+        for i, vitals in zip(simulated, batch):
+            out[i] = vitals
+    if custom:
+        results = await asyncio.gather(*(agents[i].execute() for i in custom))
+        for i, vitals in zip(custom, results):
+            out[i] = vitals
+    return out
+
+
+def create_agent_pool(count: int, seed: Optional[int] = None) -> List[BaseAgent]:
+    """Create a pool of diverse agents with real-world names and model/MCP labels.
+
+    Baseline characteristics for the whole pool are drawn from one generator,
+    so passing *seed* makes them reproducible across runs.
+    """
     agents = []
     agent_classes = [ResearchAgent, DataAgent, AnalyticsAgent, CoordinatorAgent]
-    names = (AGENT_NAMES * ((count // len(AGENT_NAMES)) + 1))[:count]
+    names = islice(cycle(AGENT_NAMES), count)
+    randint = random.Random(seed).randint
     
-    for i in range(count):
-        agent_cls = agent_classes[i % len(agent_classes)]
-        agent = agent_cls(names[i])
-        agent.model_name = MODELS[i % len(MODELS)]
-        agent.mcp_servers = MCP_SERVER_PRESETS[i % len(MCP_SERVER_PRESETS)]
-        agents.append(agent)
+    for name, agent_cls, model, mcp_servers in zip(
+        names, cycle(agent_classes), cycle(MODELS), cycle(MCP_SERVER_PRESETS)
+    ):
+        agents.append(agent_cls(
+            name,
+            model_name=model,
+            mcp_servers=list(mcp_servers),
+            base_latency_ms=randint(*agent_cls.LATENCY_RANGE_MS),
+            base_tokens=randint(*agent_cls.TOKENS_RANGE),
+            base_tool_calls=randint(*agent_cls.TOOL_CALLS_RANGE),
+        ))
     
     return agents
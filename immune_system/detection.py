@@ -65,14 +65,37 @@ class Sentinel:
         recent = recent_vitals[-sample_size:]
         n = len(recent)
 
-        avg_latency = sum(v.latency_ms for v in recent) / n
-        avg_tokens = sum(v.token_count for v in recent) / n
-        avg_tools = sum(v.tool_calls for v in recent) / n
-        avg_input = sum(getattr(v, "input_tokens", 0) for v in recent) / n
-        avg_output = sum(getattr(v, "output_tokens", 0) for v in recent) / n
-        avg_cost = sum(getattr(v, "cost", 0.0) for v in recent) / n
-        retry_rate = sum(1 for v in recent if v.retries > 0) / n
-        error_rate = sum(1 for v in recent if getattr(v, "error_type", "")) / n
+        baseline_hash = getattr(baseline, "prompt_hash", "")
+
+        # One pass over the window accumulates every metric (the window is
+        # tiny, so per-pass setup dominates the arithmetic).
+        latency = tokens = tools = input_tokens = output_tokens = 0
+        cost = 0.0
+        retried = errored = changed_count = 0
+        for v in recent:
+            latency += v.latency_ms
+            tokens += v.token_count
+            tools += v.tool_calls
+            input_tokens += getattr(v, "input_tokens", 0)
+            output_tokens += getattr(v, "output_tokens", 0)
+            cost += getattr(v, "cost", 0.0)
+            if v.retries > 0:
+                retried += 1
+            if getattr(v, "error_type", ""):
+                errored += 1
+            if baseline_hash:
+                prompt_hash = getattr(v, "prompt_hash", "")
+                if prompt_hash and prompt_hash != baseline_hash:
+                    changed_count += 1
+
+        avg_latency = latency / n
+        avg_tokens = tokens / n
+        avg_tools = tools / n
+        avg_input = input_tokens / n
+        avg_output = output_tokens / n
+        avg_cost = cost / n
+        retry_rate = retried / n
+        error_rate = errored / n
 
         deviations: Dict[str, float] = {}
         anomalies: List[AnomalyType] = []
@@ -106,15 +129,9 @@ class Sentinel:
                     anomalies.append(anomaly_type)
 
         # Prompt hash change detection
-        baseline_hash = getattr(baseline, "prompt_hash", "")
-        if baseline_hash:
-            changed_count = sum(
-                1 for v in recent
-                if getattr(v, "prompt_hash", "") and getattr(v, "prompt_hash", "") != baseline_hash
-            )
-            if changed_count >= n // 2 + 1:
-                anomalies.append(AnomalyType.PROMPT_CHANGE)
-                deviations["prompt_change"] = 10.0
+        if baseline_hash and changed_count >= n // 2 + 1:
+            anomalies.append(AnomalyType.PROMPT_CHANGE)
+            deviations["prompt_change"] = 10.0
 
         if anomalies:
             max_dev = max(deviations.values())
@@ -96,30 +96,39 @@ class Healer:
     def get_healing_policy(self, diagnosis_type: DiagnosisType) -> list:
         return HEALING_POLICIES.get(diagnosis_type, HEALING_POLICIES[DiagnosisType.UNKNOWN])
 
-    def get_next_action(
+    def get_action_plan(
         self,
         diagnosis_type: DiagnosisType,
         failed_actions: Set[HealingAction],
         immune_memory: Optional[ImmuneMemory] = None,
-    ) -> Optional[HealingAction]:
-        """Pick the next action, reordering by global success patterns when available."""
+    ) -> List[HealingAction]:
+        """Ordered actions to try: the policy minus known failures, reordered by
+        global success patterns when available.
+
+        Computed once per hypothesis; a failed action only removes itself from
+        the remaining plan (failures do not change the success ordering).
+        """
         policy = self.get_healing_policy(diagnosis_type)
         candidates = [a for a in policy if a not in failed_actions]
 
-        if not candidates:
-            return None
-
-        if immune_memory is not None:
+        if candidates and immune_memory is not None:
             successful = immune_memory.get_successful_actions(diagnosis_type)
             if successful:
-                def _sort_key(action: HealingAction) -> int:
-                    try:
-                        return successful.index(action)
-                    except ValueError:
-                        return len(successful)
-                candidates.sort(key=_sort_key)
-
-        return candidates[0]
+                rank = {action: i for i, action in enumerate(successful)}
+                unranked = len(successful)
+                candidates.sort(key=lambda action: rank.get(action, unranked))
+
+        return candidates
+
+    def get_next_action(
+        self,
+        diagnosis_type: DiagnosisType,
+        failed_actions: Set[HealingAction],
+        immune_memory: Optional[ImmuneMemory] = None,
+    ) -> Optional[HealingAction]:
+        """Pick the next action, reordering by global success patterns when available."""
+        plan = self.get_action_plan(diagnosis_type, failed_actions, immune_memory)
+        return plan[0] if plan else None
 
     async def apply_healing(self, agent, action: HealingAction, context: dict = None) -> HealingResult:
         """Apply a healing action using the configured executor or in-memory fallback."""
@@ -3,16 +3,39 @@ Logging Configuration - Structured logging for the AI Agent Immune System
 
 Provides:
 - Human-readable colored console output (default)
-- JSON structured output (opt-in via LOG_FORMAT=json env var)
+- JSON structured output (opt-in via LOG_FORMAT=json env var; uses orjson
+  when installed)
 - Proper log levels mapped to system events
-- Flush-safe stream handler for real-time output
+- Timestamps rendered once per second and reused across records
+- Batch-flushing stream handler for near-real-time output
+- Formatting and stream I/O on a background thread (LOG_QUEUE=0 to disable)
 """
+import atexit
+import copy
 import logging
+import logging.handlers
 import json
 import os
+import queue
 import sys
+import threading
 import time
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a log entry, using orjson when installed (optional speedup)."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=str, option=_orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(obj, default=str)
 
 
 # ---------------------------------------------------------------------------
@@ -43,29 +66,73 @@ _LEVEL_COLORS = {
 # ---------------------------------------------------------------------------
 # Formatters
 # ---------------------------------------------------------------------------
-class ColoredFormatter(logging.Formatter):
-    """Human-readable formatter with ANSI colours and timestamps."""
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the strftime part of asctime once per second.
+
+    Records logged within the same second share the cached string; any
+    sub-second part (the default ``,mmm`` suffix) is still added per record.
+    """
+
+    _time_cache = None  # (second, datefmt, formatted)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        datefmt = datefmt or self.datefmt
+        sec = int(record.created)
+        cached = self._time_cache
+        if cached is None or cached[0] != sec or cached[1] != datefmt:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            # Stored as one tuple so concurrent handlers never see a torn entry.
+            self._time_cache = cached = (sec, datefmt, formatted)
+        if datefmt is None and self.default_msec_format:
+            return self.default_msec_format % (cached[2], record.msecs)
+        return cached[2]
+
+
+class ColoredFormatter(_CachedTimeFormatter):
+    """Human-readable formatter with ANSI colours and timestamps.
+
+    Colours are baked into one precompiled format string per level, so the
+    record itself is never mutated (other handlers see the plain levelname
+    and logger name).
+    """
 
     FORMAT = "%(asctime)s  %(levelname)-8s  %(name)-22s  %(message)s"
+    DATEFMT = "%Y-%m-%d %H:%M:%S"
 
     def __init__(self, use_color: bool = True):
-        super().__init__(self.FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+        super().__init__(self.FORMAT, datefmt=self.DATEFMT)
         self.use_color = use_color
+        self._level_formatters: Dict[int, logging.Formatter] = {}
+        if use_color:
+            self._level_formatters = {
+                level: self._colored_formatter(color) for level, color in _LEVEL_COLORS.items()
+            }
+            self._fallback_formatter = self._colored_formatter(_Colors.RESET)
+
+    def _colored_formatter(self, level_color: str) -> logging.Formatter:
+        fmt = (
+            f"%(asctime)s  {level_color}%(levelname)-8s{_Colors.RESET}  "
+            f"{_Colors.CYAN}%(name)-22s{_Colors.RESET}  %(message)s"
+        )
+        return _CachedTimeFormatter(fmt, datefmt=self.DATEFMT)
 
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_color:
-            color = _LEVEL_COLORS.get(record.levelno, _Colors.RESET)
-            record.levelname = f"{color}{record.levelname}{_Colors.RESET}"
-            record.name = f"{_Colors.CYAN}{record.name}{_Colors.RESET}"
-        return super().format(record)
+        if not self.use_color:
+            return super().format(record)
+        formatter = self._level_formatters.get(record.levelno, self._fallback_formatter)
+        return formatter.format(record)
 
 
-class JSONFormatter(logging.Formatter):
+class JSONFormatter(_CachedTimeFormatter):
     """Structured JSON formatter suitable for log aggregation systems."""
 
+    TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
     def format(self, record: logging.LogRecord) -> str:
+        # strftime has no %f: the cached per-second prefix gets microseconds appended.
+        micros = int((record.created % 1) * 1_000_000)
         log_entry = {
-            "timestamp": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S.%f"),
+            "timestamp": f"{self.formatTime(record, self.TIMESTAMP_FORMAT)}.{micros:06d}",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -75,18 +142,126 @@ class JSONFormatter(logging.Formatter):
             log_entry["data"] = record.structured_data
         if record.exc_info and record.exc_info[0] is not None:
             log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry, default=str)
+        return _json_dumps(log_entry)
 
 
 # ---------------------------------------------------------------------------
-# Flush-safe handler (ensures every log line is flushed immediately)
+# Batch-flushing handler (near-real-time output without a flush per line)
 # ---------------------------------------------------------------------------
 class FlushStreamHandler(logging.StreamHandler):
-    """StreamHandler that flushes after every emit for real-time output."""
+    """StreamHandler that flushes in small batches for near-real-time output.
+
+    The stream is flushed once every ``FLUSH_EVERY`` records, immediately for
+    WARNING and above, and otherwise at most ``FLUSH_INTERVAL_S`` seconds
+    after the first unflushed record: a daemon flusher thread covers the case
+    where no further record arrives.  ``logging.shutdown()`` flushes whatever
+    remains.
+    """
+
+    FLUSH_EVERY = 32
+    FLUSH_INTERVAL_S = 0.1
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._dirty = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        super().emit(record)
-        self.flush()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending += 1
+        if (
+            record.levelno >= logging.WARNING
+            or self._pending >= self.FLUSH_EVERY
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S
+        ):
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="log-flush", daemon=True)
+            self._flusher.start()
+        self._dirty.set()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._dirty.wait()
+            if self._closed:
+                return
+            time.sleep(self.FLUSH_INTERVAL_S)
+            # Cleared before flushing: a record written after this point
+            # either lands in this flush or re-arms the next one.
+            self._dirty.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except ValueError:  # stream closed underneath us
+                return
+
+    def flush(self) -> None:
+        with self.lock:
+            super().flush()
+            self._pending = 0
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self._closed = True
+        self._dirty.set()
+        try:
+            self.flush()
+        except ValueError:  # stream already closed
+            pass
+        super().close()
+
+
+# ---------------------------------------------------------------------------
+# Background log queue (formatting and I/O off the calling thread)
+# ---------------------------------------------------------------------------
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    Only the message is merged in the caller (so mutable arguments are
+    captured as they were at the log call); timestamps, colours/JSON, the
+    traceback and the write itself happen on the listener thread.  Unlike the
+    stdlib prepare(), exc_info is kept since the record never gets pickled.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Drain and stop the background listener and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Registered after logging's own hook, so it runs first at exit: queued
+# records are written before logging.shutdown() flushes the handlers.
+atexit.register(_stop_queue_listener)
 
 
 # ---------------------------------------------------------------------------
@@ -95,6 +270,7 @@ class FlushStreamHandler(logging.StreamHandler):
 def setup_logging(
     level: Optional[str] = None,
     log_format: Optional[str] = None,
+    use_queue: Optional[bool] = None,
 ) -> None:
     """
     Configure the root logger for the application.
@@ -102,19 +278,29 @@ def setup_logging(
     Environment variables (overridden by explicit arguments):
         LOG_LEVEL   - DEBUG, INFO, WARNING, ERROR, CRITICAL (default: INFO)
         LOG_FORMAT  - "text" (default, colored) or "json"
+        LOG_QUEUE   - "1" (default) formats and writes records on a
+                      background thread; "0" does it inline in the caller
 
     Args:
         level: Override log level (e.g. "DEBUG").
         log_format: Override format ("text" or "json").
+        use_queue: Override LOG_QUEUE.
     """
+    global _queue_listener
     resolved_level = (level or os.environ.get("LOG_LEVEL", "INFO")).upper()
     resolved_format = (log_format or os.environ.get("LOG_FORMAT", "text")).lower()
+    if use_queue is None:
+        use_queue = os.environ.get("LOG_QUEUE", "1") != "0"
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, resolved_level, logging.INFO))
 
-    # Remove any existing handlers to avoid duplicate output on re-init
-    root_logger.handlers.clear()
+    # Remove any existing handlers to avoid duplicate output on re-init;
+    # closing them also stops their flusher threads.
+    _stop_queue_listener()
+    for old_handler in root_logger.handlers[:]:
+        root_logger.removeHandler(old_handler)
+        old_handler.close()
 
     handler = FlushStreamHandler(sys.stdout)
 
@@ -124,17 +310,54 @@ def setup_logging(
         use_color = sys.stdout.isatty() or os.environ.get("FORCE_COLOR", "") == "1"
         handler.setFormatter(ColoredFormatter(use_color=use_color))
 
-    root_logger.addHandler(handler)
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, handler)
+        _queue_listener.start()
+        root_logger.addHandler(_QueueHandler(log_queue))
+    else:
+        root_logger.addHandler(handler)
 
     # Quieten noisy third-party loggers
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
     logging.getLogger("flask").setLevel(logging.WARNING)
 
 
+class _LazyStr:
+    """Log argument that defers an expensive computation until it is rendered."""
+
+    __slots__ = ("_func", "_args", "_kwargs")
+
+    def __init__(self, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args, **self._kwargs))
+
+    __repr__ = __str__
+
+
+def lazy(func: Callable[..., Any], *args: Any, **kwargs: Any) -> _LazyStr:
+    """
+    Wrap ``func(*args, **kwargs)`` so it only runs if the record is emitted.
+
+    Usage:
+        logger.debug("Pending: %s", lazy(", ".join, sorted(pending)))
+    """
+    return _LazyStr(func, args, kwargs)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Return a named logger.
 
+    Always use %-style arguments, never f-strings or pre-formatted messages:
+    the message is then only formatted when a handler actually emits the
+    record.  For arguments that are themselves expensive to build, wrap them
+    with ``lazy()``.
+
     Usage:
         from immune_system.logging_config import get_logger
         logger = get_logger(__name__)
@@ -13,11 +13,13 @@ Integrates:
 """
 import asyncio
 import threading
+from collections import deque
+from itertools import islice
 from typing import List, Dict, Any, Optional, Tuple
 import time
 from opentelemetry import metrics
 
-from .agents import BaseAgent, AgentStatus
+from .agents import BaseAgent, AgentStatus, execute_all
 from .detection import InfectionReport, AnomalyType, Sentinel
 from .telemetry import TelemetryCollector
 from .baseline import BaselineLearner
@@ -35,8 +37,14 @@ logger = get_logger("orchestrator")
 TICK_INTERVAL_SECONDS = 1.0
 DEVIATION_REQUIRING_APPROVAL = 5.0
 SEVERE_DEVIATION_THRESHOLD = 6.0
-HEALING_STEP_DELAY_SECONDS = 1.5
 DRAIN_TIMEOUT_SECONDS = 120
+# Demo chaos waves: (seconds after run() starts, agents to infect).
+CHAOS_WAVES = ((20, 5), (45, 4), (70, 4))
+
+# Python 3.12+: tasks run synchronously up to their first await on creation.
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+# Python 3.11+: structured fan-out for the shutdown drain (gather before that).
+_TASK_GROUP = getattr(asyncio, "TaskGroup", None)
 
 
 class ImmuneSystemOrchestrator:
@@ -45,6 +53,9 @@ class ImmuneSystemOrchestrator:
     def __init__(self, agents: List[BaseAgent], store=None, cache=None,
                  enforcement=None, executor=None):
         self.agents = {agent.agent_id: agent for agent in agents}
+        # Snapshot iterated by the sentinel each tick; rebuilt by register_agent().
+        self._agents_items: Tuple[Tuple[str, BaseAgent], ...] = tuple(self.agents.items())
+        self._agents_lock = threading.Lock()
         self.store = store
         self.cache = cache
 
@@ -72,6 +83,9 @@ class ImmuneSystemOrchestrator:
         self.total_healed = 0
         self.total_failed_healings = 0
         self.start_time = time.time()
+        # Interval math (tick pacing, chaos cut-off, runtime) uses the
+        # monotonic clock; start_time stays a Unix epoch for display.
+        self._start_monotonic = time.monotonic()
 
         self.running = True
         self.baselines_learned = False
@@ -82,8 +96,13 @@ class ImmuneSystemOrchestrator:
         self._workflow_lock = threading.Lock()
 
         self.healing_in_progress: set = set()
-        self._healing_action_log: List[Dict[str, Any]] = []
+        # Set whenever healing_in_progress becomes empty; created in run() so
+        # it binds to the running loop (Python 3.9 binds at construction).
+        self._drained: Optional[asyncio.Event] = None
+        # agent_id -> current healing stage, published for the dashboard.
+        self._agent_healing_stage: Dict[str, str] = {}
         self._action_log_max = 80
+        self._healing_action_log: deque = deque(maxlen=self._action_log_max)
         self._action_log_lock = threading.Lock()
 
         meter = metrics.get_meter("immune-system.orchestrator")
@@ -100,17 +119,43 @@ class ImmuneSystemOrchestrator:
         entry = {'type': action_type, 'agent_id': agent_id, 'timestamp': time.time(), **kwargs}
         with self._action_log_lock:
             self._healing_action_log.append(entry)
-            if len(self._healing_action_log) > self._action_log_max:
-                self._healing_action_log = self._healing_action_log[-self._action_log_max:]
+
+    def _set_healing_stage(self, agent_id: str, stage: Optional[str]):
+        with self._action_log_lock:
+            if stage is None:
+                self._agent_healing_stage.pop(agent_id, None)
+            else:
+                self._agent_healing_stage[agent_id] = stage
+
+    def get_runtime(self) -> float:
+        """Seconds since the orchestrator was created (monotonic)."""
+        return time.monotonic() - self._start_monotonic
+
+    def get_healing_stages(self) -> Dict[str, str]:
+        """Current stage per agent being healed ("diagnosing", "applying",
+        "probation")."""
+        with self._action_log_lock:
+            return dict(self._agent_healing_stage)
 
     def get_healing_actions(self) -> List[Dict[str, Any]]:
         if self.store:
             return self.store.get_recent_actions(limit=50)
         with self._action_log_lock:
-            return list(self._healing_action_log[-50:])
+            log = self._healing_action_log
+            return list(islice(log, max(0, len(log) - 50), None))
 
     # ── Infection serialization ──────────────────────────────────────
 
+    @staticmethod
+    def _anomaly_names(infection: InfectionReport) -> Tuple[str, ...]:
+        return tuple(a.value for a in infection.anomalies)
+
+    @classmethod
+    def _entry_anomalies(cls, entry: Dict[str, Any]) -> Tuple[str, ...]:
+        """Anomaly names frozen on a pending/rejected entry when it was queued."""
+        names = entry.get('anomalies')
+        return names if names is not None else cls._anomaly_names(entry['infection'])
+
     @staticmethod
     def _serialize_infection(infection: InfectionReport) -> Dict[str, Any]:
         return {
@@ -204,59 +249,80 @@ class ImmuneSystemOrchestrator:
         return InfectionReport(agent_id=agent.agent_id, max_deviation=max_dev,
                                anomalies=anomalies, deviations=deviations)
 
-    # ── Agent loop ───────────────────────────────────────────────────
+    # ── Agent registry ───────────────────────────────────────────────
 
-    async def run_agent_loop(self, agent: BaseAgent):
-        """Run agent on a 1s tick.  Respects lifecycle blocking."""
-        while self.running:
-            tick_start = time.time()
+    def register_agent(self, agent: BaseAgent) -> bool:
+        """Add an agent at runtime (e.g. an external agent reporting via the API).
 
-            if not self.lifecycle.is_execution_allowed(agent.agent_id):
-                await asyncio.sleep(TICK_INTERVAL_SECONDS)
-                continue
+        Returns False if an agent with the same id is already registered.
+        """
+        with self._agents_lock:
+            if agent.agent_id in self.agents:
+                return False
+            self.agents[agent.agent_id] = agent
+            self._agents_items = tuple(self.agents.items())
+        return True
 
-            vitals = await agent.execute()
-            self.telemetry.record(vitals)
-
-            from .telemetry import AgentVitals
-            v = AgentVitals(
-                timestamp=vitals['timestamp'], agent_id=vitals['agent_id'],
-                agent_type=vitals['agent_type'], latency_ms=vitals['latency_ms'],
-                token_count=vitals.get('token_count', 0), tool_calls=vitals['tool_calls'],
-                retries=vitals['retries'], success=vitals['success'],
-                input_tokens=vitals.get('input_tokens', 0),
-                output_tokens=vitals.get('output_tokens', 0),
-                cost=vitals.get('cost', 0.0), model=vitals.get('model', ''),
-                error_type=vitals.get('error_type', ''),
-                prompt_hash=vitals.get('prompt_hash', ''),
-            )
-            self.baseline_learner.update(agent.agent_id, v)
-
-            phase = self.lifecycle.get_phase(agent.agent_id)
-            if phase == AgentPhase.INITIALIZING and self.baseline_learner.has_baseline(agent.agent_id):
-                self.lifecycle.mark_baseline_ready(agent.agent_id)
-                self._sync_agent_phase(agent.agent_id)
+    # ── Agent tick loop ──────────────────────────────────────────────
 
-            if phase == AgentPhase.PROBATION:
-                count = self.lifecycle.record_probation_tick(agent.agent_id)
-                if self.lifecycle.probation_complete(agent.agent_id):
-                    healthy = await self.healer.validate_probation(agent.agent_id)
-                    if healthy:
-                        self.lifecycle.mark_healthy(agent.agent_id, "probation_passed")
-                        self._release_quarantine(agent)
-                        self.total_healed += 1
-                        self._log_action("probation_passed", agent.agent_id)
-                        logger.info("PROBATION PASSED: %s released to HEALTHY", agent.agent_id)
-                    else:
-                        self.lifecycle.transition(agent.agent_id, AgentPhase.HEALING,
-                                                  "probation_failed")
-                        self._log_action("probation_failed", agent.agent_id)
-                        logger.warning("PROBATION FAILED: %s back to HEALING", agent.agent_id)
-                    self._sync_agent_phase(agent.agent_id)
+    async def tick_loop(self, agents: List[BaseAgent]):
+        """Run all agents on one shared 1s tick.  Respects lifecycle blocking.
 
-            elapsed = time.time() - tick_start
+        A single coroutine drives the whole pool: agents allowed to run this
+        tick execute together via execute_all(), their vitals are recorded
+        and folded into the baselines in the same pass, and the loop sleeps
+        once per tick instead of once per agent.
+        """
+        now = time.monotonic
+        while self.running:
+            tick_start = now()
+
+            is_allowed = self.lifecycle.is_execution_allowed
+            runnable = [agent for agent in agents if is_allowed(agent.agent_id)]
+            if runnable:
+                # One failing agent or store call must not stop the shared
+                # tick: log it and carry on with the next agent / tick.
+                try:
+                    results = await execute_all(runnable)
+                except Exception:
+                    logger.exception("Agent execution failed for this tick")
+                    results = ()
+                for agent, vitals in zip(runnable, results):
+                    try:
+                        await self._process_vitals(agent, vitals)
+                    except Exception:
+                        logger.exception("Failed to process vitals for %s", agent.agent_id)
+
+            elapsed = now() - tick_start
             await asyncio.sleep(max(0.0, TICK_INTERVAL_SECONDS - elapsed))
 
+    async def _process_vitals(self, agent: BaseAgent, vitals):
+        """Record one execution and advance the agent's baseline / probation state."""
+        vitals = self.telemetry.record(vitals)
+        self.baseline_learner.update(agent.agent_id, vitals)
+
+        phase = self.lifecycle.get_phase(agent.agent_id)
+        if phase == AgentPhase.INITIALIZING and self.baseline_learner.has_baseline(agent.agent_id):
+            self.lifecycle.mark_baseline_ready(agent.agent_id)
+            self._sync_agent_phase(agent.agent_id)
+
+        if phase == AgentPhase.PROBATION:
+            self.lifecycle.record_probation_tick(agent.agent_id)
+            if self.lifecycle.probation_complete(agent.agent_id):
+                healthy = await self.healer.validate_probation(agent.agent_id)
+                if healthy:
+                    self.lifecycle.mark_healthy(agent.agent_id, "probation_passed")
+                    self._release_quarantine(agent)
+                    self.total_healed += 1
+                    self._log_action("probation_passed", agent.agent_id)
+                    logger.info("PROBATION PASSED: %s released to HEALTHY", agent.agent_id)
+                else:
+                    self.lifecycle.transition(agent.agent_id, AgentPhase.HEALING,
+                                              "probation_failed")
+                    self._log_action("probation_failed", agent.agent_id)
+                    logger.warning("PROBATION FAILED: %s back to HEALING", agent.agent_id)
+                self._sync_agent_phase(agent.agent_id)
+
     # ── Sentinel loop ────────────────────────────────────────────────
 
     async def sentinel_loop(self):
@@ -266,13 +332,23 @@ class ImmuneSystemOrchestrator:
         logger.info("SENTINEL ACTIVE - Monitoring for infections")
         self.baselines_learned = True
 
+        # Per-agent lookups and thresholds bound once, outside the tick loop.
+        create_task = asyncio.get_running_loop().create_task
+        get_phase = self.lifecycle.get_phase
+        get_baseline = self.baseline_learner.get_baseline
+        get_recent = self.telemetry.get_recent
+        detect_infection = self.sentinel.detect_infection
+        skipped_phases = (AgentPhase.QUARANTINED, AgentPhase.HEALING,
+                          AgentPhase.EXHAUSTED, AgentPhase.DRAINING,
+                          AgentPhase.INITIALIZING)
+        severe_threshold = SEVERE_DEVIATION_THRESHOLD
+        approval_threshold = DEVIATION_REQUIRING_APPROVAL
+        tick = TICK_INTERVAL_SECONDS
         while self.running:
-            for agent_id, agent in self.agents.items():
-                phase = self.lifecycle.get_phase(agent_id)
+            for agent_id, agent in self._agents_items:
+                phase = get_phase(agent_id)
 
-                if phase in (AgentPhase.QUARANTINED, AgentPhase.HEALING,
-                             AgentPhase.EXHAUSTED, AgentPhase.DRAINING,
-                             AgentPhase.INITIALIZING):
+                if phase in skipped_phases:
                     if phase == AgentPhase.DRAINING and self.lifecycle.check_drain_timeout(agent_id):
                         self.lifecycle.complete_drain(agent_id)
                         self.quarantine.quarantine(agent_id)
@@ -280,17 +356,20 @@ class ImmuneSystemOrchestrator:
                         self._sync_agent_phase(agent_id)
                     continue
 
-                baseline = self.baseline_learner.get_baseline(agent_id)
+                # Served from the learner's in-memory baselines (kept current as
+                # samples arrive); get_baseline() is None exactly when
+                # has_baseline() is False, so one lookup answers both.
+                baseline = get_baseline(agent_id)
 
                 if agent.infected:
                     infection = self._fallback_infection_from_agent_state(agent)
                 else:
-                    if not self.baseline_learner.has_baseline(agent_id):
+                    if baseline is None:
                         continue
-                    recent = self.telemetry.get_recent(agent_id, window_seconds=10)
+                    recent = get_recent(agent_id, window_seconds=10)
                     if not recent:
                         continue
-                    infection = self.sentinel.detect_infection(recent, baseline)
+                    infection = detect_infection(recent, baseline)
 
                 if infection is None:
                     if phase == AgentPhase.SUSPECTED:
@@ -311,12 +390,12 @@ class ImmuneSystemOrchestrator:
                             continue
 
                 if phase == AgentPhase.HEALTHY:
-                    if infection.max_deviation >= SEVERE_DEVIATION_THRESHOLD:
+                    if infection.max_deviation >= severe_threshold:
                         self.lifecycle.force_drain(agent_id, "severe_anomaly")
                     else:
                         self.lifecycle.record_anomaly_tick(agent_id)
                     self._sync_agent_phase(agent_id)
-                    if self.lifecycle.get_phase(agent_id) not in (AgentPhase.DRAINING,):
+                    if get_phase(agent_id) != AgentPhase.DRAINING:
                         continue
 
                 if phase == AgentPhase.SUSPECTED:
@@ -340,7 +419,7 @@ class ImmuneSystemOrchestrator:
                     )
                     self._log_action("fleet_wide_anomaly", agent_id,
                                      detail=correlation.detail)
-                    if self.lifecycle.get_phase(agent_id) == AgentPhase.SUSPECTED:
+                    if get_phase(agent_id) == AgentPhase.SUSPECTED:
                         self.lifecycle.record_anomaly_resolved(agent_id)
                         self._sync_agent_phase(agent_id)
                     continue
@@ -349,17 +428,17 @@ class ImmuneSystemOrchestrator:
                 self._infection_counter.add(
                     1, attributes={
                         "agent_id": agent_id,
-                        "deviation_band": "severe" if infection.max_deviation >= DEVIATION_REQUIRING_APPROVAL else "mild",
+                        "deviation_band": "severe" if infection.max_deviation >= approval_threshold else "mild",
                     },
                 )
 
-                anomaly_names = ", ".join(a.value for a in infection.anomalies)
+                anomaly_names = self._anomaly_names(infection)
                 logger.warning(
                     "INFECTION DETECTED: %s | max_dev=%.2fσ | anomalies=[%s]",
-                    agent_id, infection.max_deviation, anomaly_names,
+                    agent_id, infection.max_deviation, ", ".join(anomaly_names),
                 )
 
-                if self.lifecycle.get_phase(agent_id) != AgentPhase.DRAINING:
+                if get_phase(agent_id) != AgentPhase.DRAINING:
                     self.lifecycle.force_drain(agent_id, "quarantine_ordered")
                 self.lifecycle.complete_drain(agent_id)
                 self.quarantine.quarantine(agent_id)
@@ -380,7 +459,7 @@ class ImmuneSystemOrchestrator:
                     correlation_detail=correlation.detail,
                 )
 
-                if infection.max_deviation >= DEVIATION_REQUIRING_APPROVAL:
+                if infection.max_deviation >= approval_threshold:
                     diagnosis_result = self.diagnostician.diagnose(infection, baseline, ctx)
                     diagnosis = diagnosis_result.primary
                     if self.store:
@@ -407,6 +486,7 @@ class ImmuneSystemOrchestrator:
                                 'infection': infection,
                                 'diagnosis': diagnosis,
                                 'diagnosis_result': diagnosis_result,
+                                'anomalies': anomaly_names,
                                 'requested_at': time.time(),
                             }
                     self._approval_counter.add(1, attributes={"decision": "requested", "agent_id": agent_id})
@@ -417,9 +497,9 @@ class ImmuneSystemOrchestrator:
                         agent_id, infection.max_deviation,
                     )
                 else:
-                    asyncio.create_task(self.heal_agent(agent_id, infection, context=ctx))
+                    create_task(self.heal_agent(agent_id, infection, context=ctx))
 
-            await asyncio.sleep(TICK_INTERVAL_SECONDS)
+            await asyncio.sleep(tick)
 
     # ── Approval workflow ────────────────────────────────────────────
 
@@ -441,7 +521,7 @@ class ImmuneSystemOrchestrator:
                 out.append({
                     'agent_id': agent_id,
                     'max_deviation': round(inf.max_deviation, 2),
-                    'anomalies': [a.value for a in inf.anomalies],
+                    'anomalies': self._entry_anomalies(data),
                     'diagnosis_type': diag.diagnosis_type.value,
                     'reasoning': diag.reasoning,
                     'requested_at': data['requested_at'],
@@ -486,35 +566,50 @@ class ImmuneSystemOrchestrator:
             entry = self._pending_approvals.pop(agent_id, None)
         if not entry:
             return None, False
-        infection = entry['infection']
-        diagnosis = entry['diagnosis']
+        if self._resolve_pending({agent_id: entry}, approved):
+            return entry['infection'], True
+        return None, False
+
+    def _resolve_pending(self, entries: Dict[str, Dict[str, Any]],
+                         approved: bool) -> List[Tuple[str, InfectionReport]]:
+        """Apply an approve/reject decision to entries already taken out of
+        ``_pending_approvals`` (in-memory mode).  Returns the approved ones."""
         if approved:
-            self._log_action("user_approved", agent_id)
-            return infection, True
-        self._log_action("user_rejected", agent_id)
+            for agent_id in entries:
+                self._log_action("user_approved", agent_id)
+            return [(agent_id, entry['infection']) for agent_id, entry in entries.items()]
+
+        for agent_id in entries:
+            self._log_action("user_rejected", agent_id)
+        rejected_at = time.time()
         with self._pending_lock:
-            self._rejected_approvals[agent_id] = {
-                'infection': infection,
-                'diagnosis': diagnosis,
-                'rejected_at': time.time(),
-            }
-        self.lifecycle.mark_exhausted(agent_id)
-        self._sync_agent_phase(agent_id)
-        logger.warning("Healing rejected for %s — quarantined until 'Heal now'", agent_id)
-        return None, False
+            for agent_id, entry in entries.items():
+                self._rejected_approvals[agent_id] = {
+                    'infection': entry['infection'],
+                    'diagnosis': entry['diagnosis'],
+                    'anomalies': self._entry_anomalies(entry),
+                    'rejected_at': rejected_at,
+                }
+        for agent_id in entries:
+            self.lifecycle.mark_exhausted(agent_id)
+            self._sync_agent_phase(agent_id)
+            logger.warning("Healing rejected for %s — quarantined until 'Heal now'", agent_id)
+        return []
 
     def approve_all_pending(self, approved: bool) -> List[Tuple[str, InfectionReport]]:
         if self.store:
             agent_ids = [item["agent_id"] for item in self.store.get_pending_approvals()]
-        else:
-            with self._pending_lock:
-                agent_ids = list(self._pending_approvals.keys())
-        approved_list = []
-        for agent_id in agent_ids:
-            infection, did_approve = self.approve_healing(agent_id, approved)
-            if did_approve and infection:
-                approved_list.append((agent_id, infection))
-        return approved_list
+            approved_list = []
+            for agent_id in agent_ids:
+                infection, did_approve = self.approve_healing(agent_id, approved)
+                if did_approve and infection:
+                    approved_list.append((agent_id, infection))
+            return approved_list
+
+        # In-memory: take every pending entry in one critical section.
+        with self._pending_lock:
+            entries, self._pending_approvals = self._pending_approvals, {}
+        return self._resolve_pending(entries, approved)
 
     def get_rejected_approvals(self) -> List[Dict[str, Any]]:
         if self.store:
@@ -527,13 +622,21 @@ class ImmuneSystemOrchestrator:
                 out.append({
                     'agent_id': agent_id,
                     'max_deviation': round(inf.max_deviation, 2),
-                    'anomalies': [a.value for a in inf.anomalies],
+                    'anomalies': self._entry_anomalies(data),
                     'diagnosis_type': diag.diagnosis_type.value,
                     'reasoning': diag.reasoning,
                     'rejected_at': data['rejected_at'],
                 })
             return out
 
+    def _start_rejected(self, entries: Dict[str, Dict[str, Any]]) -> List[Tuple[str, InfectionReport]]:
+        """Record 'Heal now' for entries already taken out of
+        ``_rejected_approvals`` (in-memory mode).  Returns them for healing."""
+        for agent_id in entries:
+            self._log_action("explicit_heal_requested", agent_id)
+            logger.info("Agent %s — healing started (Heal now)", agent_id)
+        return [(agent_id, entry['infection']) for agent_id, entry in entries.items()]
+
     def start_healing_explicitly(self, agent_id: str) -> Optional[InfectionReport]:
         if self.store:
             with self._workflow_lock:
@@ -558,23 +661,22 @@ class ImmuneSystemOrchestrator:
             entry = self._rejected_approvals.pop(agent_id, None)
         if not entry:
             return None
-        infection = entry['infection']
-        self._log_action("explicit_heal_requested", agent_id)
-        logger.info("Agent %s — healing started (Heal now)", agent_id)
-        return infection
+        return self._start_rejected({agent_id: entry})[0][1]
 
     def start_healing_all_rejected(self) -> List[Tuple[str, InfectionReport]]:
         if self.store:
             agent_ids = [item["agent_id"] for item in self.store.get_rejected_approvals()]
-        else:
-            with self._pending_lock:
-                agent_ids = list(self._rejected_approvals.keys())
-        result = []
-        for agent_id in agent_ids:
-            infection = self.start_healing_explicitly(agent_id)
-            if infection:
-                result.append((agent_id, infection))
-        return result
+            result = []
+            for agent_id in agent_ids:
+                infection = self.start_healing_explicitly(agent_id)
+                if infection:
+                    result.append((agent_id, infection))
+            return result
+
+        # In-memory: take every rejected entry in one critical section.
+        with self._pending_lock:
+            entries, self._rejected_approvals = self._rejected_approvals, {}
+        return self._start_rejected(entries)
 
     # ── Operator feedback ────────────────────────────────────────────
 
@@ -601,6 +703,9 @@ class ImmuneSystemOrchestrator:
                          trigger: str = "auto", context: DiagnosisContext = None):
         """Heal using multi-hypothesis diagnosis, success-weighted selection, and probation."""
         self.healing_in_progress.add(agent_id)
+        if self._drained is not None:
+            self._drained.clear()
+        self._set_healing_stage(agent_id, "diagnosing")
         try:
             agent = self.agents[agent_id]
             baseline = self.baseline_learner.get_baseline(agent_id)
@@ -612,7 +717,9 @@ class ImmuneSystemOrchestrator:
             diagnosis_result = self.diagnostician.diagnose(infection, baseline, ctx)
             logger.info("Diagnosis for %s: %s", agent_id, diagnosis_result)
 
-            await asyncio.sleep(HEALING_STEP_DELAY_SECONDS)
+            # Progress is published as stages for the dashboard to poll, so the
+            # steps only yield to the loop rather than sleeping for visibility.
+            await asyncio.sleep(0)
 
             for hypothesis in diagnosis_result.hypotheses:
                 dtype = hypothesis.diagnosis_type
@@ -627,19 +734,19 @@ class ImmuneSystemOrchestrator:
                                 agent_id, dtype.value,
                                 ", ".join(a.value for a in failed_actions))
 
-                while True:
-                    next_action = self.healer.get_next_action(dtype, failed_actions, self.immune_memory)
-                    if not next_action:
-                        logger.warning("All actions exhausted for %s/%s", agent_id, dtype.value)
-                        break
-
+                # Policy order and known failures are resolved once per
+                # hypothesis; each failed attempt just moves on to the next action.
+                plan = self.healer.get_action_plan(dtype, failed_actions, self.immune_memory)
+                for next_action in plan:
                     logger.info("Attempting %s on %s (hypothesis=%s)",
                                 next_action.value, agent_id, dtype.value)
 
+                    self._set_healing_stage(agent_id, "applying")
                     result = await self.healer.apply_healing(agent, next_action)
-                    await asyncio.sleep(HEALING_STEP_DELAY_SECONDS)
+                    await asyncio.sleep(0)
 
                     if result.success:
+                        self._set_healing_stage(agent_id, "probation")
                         self.lifecycle.enter_probation(agent_id)
                         self._sync_agent_phase(agent_id)
                         self.quarantine.release(agent_id)
@@ -670,7 +777,6 @@ class ImmuneSystemOrchestrator:
                             self.quarantine.quarantine(agent_id)
                             self.lifecycle.transition(agent_id, AgentPhase.HEALING, "probation_failed")
                             self._sync_agent_phase(agent_id)
-                            failed_actions = failed_actions | {next_action}
                     else:
                         self.immune_memory.record_healing(
                             agent_id=agent_id, diagnosis_type=dtype,
@@ -682,15 +788,19 @@ class ImmuneSystemOrchestrator:
                             success=False, trigger=trigger,
                         )
                         self.total_failed_healings += 1
-                        failed_actions = failed_actions | {next_action}
-                        await asyncio.sleep(HEALING_STEP_DELAY_SECONDS)
+                        await asyncio.sleep(0)
+
+                logger.warning("All actions exhausted for %s/%s", agent_id, dtype.value)
 
             logger.error("All hypotheses and actions exhausted for %s", agent_id)
             self.lifecycle.mark_exhausted(agent_id)
             self._sync_agent_phase(agent_id)
 
         finally:
+            self._set_healing_stage(agent_id, None)
             self.healing_in_progress.discard(agent_id)
+            if self._drained is not None and not self.healing_in_progress:
+                self._drained.set()
 
     async def _run_probation(self, agent_id: str, agent: BaseAgent) -> bool:
         """Run the probation loop: let agent execute, collect fresh vitals, validate."""
@@ -703,44 +813,49 @@ class ImmuneSystemOrchestrator:
 
         return await self.healer.validate_probation(agent_id)
 
+    async def _drain_heal(self, agent_id: str, infection: InfectionReport, trigger: str):
+        """Heal one agent during the drain; a failure is logged, not raised."""
+        try:
+            await self.heal_agent(agent_id, infection, trigger=trigger)
+        except Exception:
+            logger.exception("Drain healing failed for %s", agent_id)
+
+    async def _heal_all(self, jobs: List[Tuple[str, InfectionReport, str]]):
+        """Run heal_agent for every (agent_id, infection, trigger) concurrently."""
+        if _TASK_GROUP is not None:
+            async with _TASK_GROUP() as tg:
+                for agent_id, infection, trigger in jobs:
+                    tg.create_task(self._drain_heal(agent_id, infection, trigger))
+        elif jobs:
+            await asyncio.gather(*(self._drain_heal(agent_id, infection, trigger)
+                                   for agent_id, infection, trigger in jobs))
+
     # ── Chaos injection (demo) ───────────────────────────────────────
 
-    async def chaos_injection_schedule(self, duration_seconds: int = 120):
-        no_inject_after = self.start_time + max(0, duration_seconds - 5)
+    def chaos_injection_schedule(self, duration_seconds: int = 120) -> List[asyncio.TimerHandle]:
+        """Post one timer per chaos wave; cancel the returned handles to stop them."""
+        loop = asyncio.get_running_loop()
+        no_inject_after = self._start_monotonic + max(0, duration_seconds - 5)
         agents_list = list(self.agents.values())
+        return [
+            loop.call_later(delay, self._inject_wave, wave, count, agents_list, no_inject_after)
+            for wave, (delay, count) in enumerate(CHAOS_WAVES, start=1)
+        ]
 
-        await asyncio.sleep(20)
-        if time.time() >= no_inject_after or not self.running:
-            return
-        logger.info("CHAOS INJECTION (wave 1)")
-        results = self.chaos.inject_random_failure(agents_list, count=5)
-        for agent_id, infection_type in results:
-            logger.info("Injected %s into %s", infection_type, agent_id)
-
-        await asyncio.sleep(25)
-        if time.time() >= no_inject_after or not self.running:
+    def _inject_wave(self, wave: int, count: int, agents_list: List[BaseAgent],
+                     no_inject_after: float):
+        if time.monotonic() >= no_inject_after or not self.running:
             return
-        available = [a for a in agents_list if not a.infected]
-        if available:
-            logger.info("CHAOS INJECTION (wave 2)")
-            wave2 = self.chaos.inject_random_failure(available, count=min(4, len(available)))
-            for agent_id, infection_type in wave2:
-                logger.info("Injected %s into %s", infection_type, agent_id)
-
-        await asyncio.sleep(25)
-        if time.time() >= no_inject_after or not self.running:
+        if all(a.infected for a in agents_list):
             return
-        available = [a for a in agents_list if not a.infected]
-        if available:
-            logger.info("CHAOS INJECTION (wave 3)")
-            wave3 = self.chaos.inject_random_failure(available, count=min(4, len(available)))
-            for agent_id, infection_type in wave3:
-                logger.info("Injected %s into %s", infection_type, agent_id)
+        logger.info("CHAOS INJECTION (wave %d)", wave)
+        for agent_id, infection_type in self.chaos.inject_random_failure(agents_list, count=count):
+            logger.info("Injected %s into %s", infection_type, agent_id)
 
     # ── Summary / reporting ──────────────────────────────────────────
 
     def print_summary(self):
-        runtime = time.time() - self.start_time
+        runtime = self.get_runtime()
         resolution_rate = (self.total_healed / self.total_infections) if self.total_infections else 0.0
 
         summary_lines = [
@@ -778,37 +893,46 @@ class ImmuneSystemOrchestrator:
         logger.info("AI AGENT IMMUNE SYSTEM - Running %d agents with autonomous healing", len(self.agents))
         logger.info("=" * 70)
 
-        agent_tasks = [asyncio.create_task(self.run_agent_loop(agent))
-                       for agent in self.agents.values()]
-        sentinel_task = asyncio.create_task(self.sentinel_loop())
-        chaos_task = asyncio.create_task(self.chaos_injection_schedule(duration_seconds))
-
-        await asyncio.sleep(duration_seconds)
-
-        logger.info("Draining: healing all quarantined agents before shutdown")
-        drain_tasks = []
-        approved_list = self.approve_all_pending(True)
-        for agent_id, infection in approved_list:
-            drain_tasks.append(asyncio.create_task(
-                self.heal_agent(agent_id, infection, trigger="drain_approve")))
-        rejected_list = self.start_healing_all_rejected()
-        for agent_id, infection in rejected_list:
-            drain_tasks.append(asyncio.create_task(
-                self.heal_agent(agent_id, infection, trigger="drain_heal_now")))
-        if drain_tasks:
-            await asyncio.gather(*drain_tasks)
-        deadline = time.time() + DRAIN_TIMEOUT_SECONDS
-        while self.healing_in_progress and time.time() < deadline:
-            await asyncio.sleep(0.5)
-        if self.healing_in_progress:
-            logger.warning("Drain timeout: some healing still in progress")
-        else:
-            logger.info("All quarantined agents healed")
-
-        self.running = False
-        logger.info("Shutting down immune system")
-
-        for task in agent_tasks + [sentinel_task, chaos_task]:
-            task.cancel()
-
+        # Start new tasks (notably heal_agent) eagerly: their synchronous
+        # prefix runs at create_task() instead of after a ready-queue round
+        # trip.  No-op before Python 3.12.
+        loop = asyncio.get_running_loop()
+        previous_task_factory = loop.get_task_factory()
+        if _EAGER_TASK_FACTORY is not None:
+            loop.set_task_factory(_EAGER_TASK_FACTORY)
+        # Tick/sentinel tasks and chaos timer handles, cancelled on shutdown.
+        background: List[Any] = []
+        try:
+            self._drained = asyncio.Event()
+            if not self.healing_in_progress:
+                self._drained.set()
+
+            # Agents registered later through the dashboard are external: they
+            # report their own vitals and are not driven by the tick loop.
+            background.append(asyncio.create_task(self.tick_loop(list(self.agents.values()))))
+            background.append(asyncio.create_task(self.sentinel_loop()))
+            background.extend(self.chaos_injection_schedule(duration_seconds))
+
+            await asyncio.sleep(duration_seconds)
+
+            logger.info("Draining: healing all quarantined agents before shutdown")
+            jobs = [(agent_id, infection, "drain_approve")
+                    for agent_id, infection in self.approve_all_pending(True)]
+            jobs.extend((agent_id, infection, "drain_heal_now")
+                        for agent_id, infection in self.start_healing_all_rejected())
+            await self._heal_all(jobs)
+            # Heals started elsewhere (sentinel, dashboard) may still be running.
+            try:
+                await asyncio.wait_for(self._drained.wait(), DRAIN_TIMEOUT_SECONDS)
+                logger.info("All quarantined agents healed")
+            except asyncio.TimeoutError:
+                logger.warning("Drain timeout: some healing still in progress")
+        finally:
+            # Shut down on every exit path (drain errors, cancellation): stop
+            # the loops and chaos timers, and don't leave a reused loop eager.
+            self.running = False
+            logger.info("Shutting down immune system")
+            for task_or_handle in background:
+                task_or_handle.cancel()
+            loop.set_task_factory(previous_task_factory)
         self.print_summary()
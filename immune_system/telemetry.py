@@ -1,8 +1,8 @@
 """
 Telemetry Collection - Store and query agent vitals
 """
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass
+from typing import List, Dict, Optional, Set, Union
 from collections import defaultdict, deque
 import time
 
@@ -36,6 +36,10 @@ class TelemetryCollector:
     def __init__(self, store=None):
         self.store = store
         self.data: Dict[str, deque] = defaultdict(lambda: deque(maxlen=_MAX_IN_MEMORY_SAMPLES))
+        # Agents that ever recorded a sample older than their previous one
+        # (external ingest may send past timestamps); get_recent() cannot stop
+        # early for these.
+        self._out_of_order: Set[str] = set()
         self._total_executions = 0
 
         meter = metrics.get_meter("immune-system.telemetry")
@@ -54,13 +58,45 @@ class TelemetryCollector:
             return self.store.get_total_executions()
         return self._total_executions
     
-    def record(self, vitals_dict: Dict):
-        """Record telemetry data"""
+    def record(self, vitals: Union[AgentVitals, Dict]) -> AgentVitals:
+        """Record telemetry data and return it as AgentVitals.
+
+        Accepts the AgentVitals produced by the agents as-is; plain dicts
+        (external ingest) are normalised into an AgentVitals first.
+        """
+        vitals_dict = None
+        if not isinstance(vitals, AgentVitals):
+            vitals_dict = vitals
+            vitals = self._vitals_from_dict(vitals_dict)
+
+        attributes = {"agent_id": vitals.agent_id, "agent_type": vitals.agent_type}
+        self._exec_counter.add(1, attributes=attributes)
+        self._latency_hist.record(vitals.latency_ms, attributes=attributes)
+        self._token_hist.record(vitals.token_count, attributes=attributes)
+        self._tool_hist.record(vitals.tool_calls, attributes=attributes)
+        self._retry_hist.record(vitals.retries, attributes=attributes)
+        self._input_token_hist.record(vitals.input_tokens, attributes=attributes)
+        self._output_token_hist.record(vitals.output_tokens, attributes=attributes)
+        self._cost_hist.record(vitals.cost, attributes=attributes)
+
+        if self.store:
+            # Stores take dicts; convert only at this boundary.
+            self.store.write_agent_vitals(vitals_dict if vitals_dict is not None else asdict(vitals))
+            return vitals
+
+        samples = self.data[vitals.agent_id]
+        if samples and vitals.timestamp < samples[-1].timestamp:
+            self._out_of_order.add(vitals.agent_id)
+        samples.append(vitals)
+        self._total_executions += 1
+        return vitals
+
+    @staticmethod
+    def _vitals_from_dict(vitals_dict: Dict) -> AgentVitals:
         input_tokens = vitals_dict.get('input_tokens', 0)
         output_tokens = vitals_dict.get('output_tokens', 0)
         token_count = vitals_dict.get('token_count', input_tokens + output_tokens)
-
-        vitals = AgentVitals(
+        return AgentVitals(
             timestamp=vitals_dict['timestamp'],
             agent_id=vitals_dict['agent_id'],
             agent_type=vitals_dict['agent_type'],
@@ -76,22 +112,6 @@ class TelemetryCollector:
             error_type=vitals_dict.get('error_type', ''),
             prompt_hash=vitals_dict.get('prompt_hash', ''),
         )
-        attributes = {"agent_id": vitals.agent_id, "agent_type": vitals.agent_type}
-        self._exec_counter.add(1, attributes=attributes)
-        self._latency_hist.record(vitals.latency_ms, attributes=attributes)
-        self._token_hist.record(vitals.token_count, attributes=attributes)
-        self._tool_hist.record(vitals.tool_calls, attributes=attributes)
-        self._retry_hist.record(vitals.retries, attributes=attributes)
-        self._input_token_hist.record(vitals.input_tokens, attributes=attributes)
-        self._output_token_hist.record(vitals.output_tokens, attributes=attributes)
-        self._cost_hist.record(vitals.cost, attributes=attributes)
-
-        if self.store:
-            self.store.write_agent_vitals(vitals_dict)
-            return
-
-        self.data[vitals.agent_id].append(vitals)
-        self._total_executions += 1
     
     def get_recent(self, agent_id: str, window_seconds: float = 30) -> List[AgentVitals]:
         """Get recent telemetry within time window"""
@@ -99,11 +119,23 @@ class TelemetryCollector:
             rows = self.store.get_recent_agent_vitals(agent_id, window_seconds=window_seconds)
             return [AgentVitals(**row) for row in rows]
 
-        if agent_id not in self.data:
+        samples = self.data.get(agent_id)
+        if not samples:
             return []
-        
+
         cutoff_time = time.time() - window_seconds
-        return [v for v in self.data[agent_id] if v.timestamp >= cutoff_time]
+        if agent_id in self._out_of_order:
+            return [v for v in samples if v.timestamp >= cutoff_time]
+
+        # Samples are in timestamp order: walk back from the newest and stop
+        # at the cutoff instead of filtering the whole buffer.
+        recent = []
+        for v in reversed(samples):
+            if v.timestamp < cutoff_time:
+                break
+            recent.append(v)
+        recent.reverse()
+        return recent
     
     def get_all(self, agent_id: str) -> List[AgentVitals]:
         """Get all telemetry for an agent"""
@@ -52,8 +52,9 @@ class WebDashboard:
         return jsonify({
             'running': self.orchestrator.running,
             'baselines_learned': self.orchestrator.baselines_learned,
-            'runtime': time.time() - self.orchestrator.start_time,
+            'runtime': self.orchestrator.get_runtime(),
             'healing_in_progress': list(self.orchestrator.healing_in_progress),
+            'healing_stages': self.orchestrator.get_healing_stages(),
         })
     
     def get_agents(self):
@@ -227,12 +228,11 @@ class WebDashboard:
 
         if agent_id not in self.orchestrator.agents:
             from .agents import BaseAgent
-            agent = BaseAgent(
+            self.orchestrator.register_agent(BaseAgent(
                 agent_id=agent_id,
                 agent_type=data.get('agent_type', 'external'),
                 model_name=data.get('model', 'unknown'),
-            )
-            self.orchestrator.agents[agent_id] = agent
+            ))
 
         vitals_dict = {
             'agent_id': agent_id,
@@ -268,16 +268,14 @@ class WebDashboard:
         if not agent_id:
             return jsonify({'ok': False, 'error': 'agent_id is required'}), 400
 
-        if agent_id in self.orchestrator.agents:
-            return jsonify({'ok': True, 'status': 'already_registered'})
-
         from .agents import BaseAgent
         agent = BaseAgent(
             agent_id=agent_id,
             agent_type=data.get('agent_type', 'external'),
             model_name=data.get('model', 'unknown'),
         )
-        self.orchestrator.agents[agent_id] = agent
+        if not self.orchestrator.register_agent(agent):
+            return jsonify({'ok': True, 'status': 'already_registered'})
         return jsonify({'ok': True, 'status': 'registered'})
 
     def post_feedback(self):
@@ -300,7 +298,7 @@ class WebDashboard:
     def get_stats(self):
         """Get overall statistics"""
         patterns = self.orchestrator.immune_memory.get_pattern_summary()
-        runtime_seconds = time.time() - self.orchestrator.start_time
+        runtime_seconds = self.orchestrator.get_runtime()
         current_infected = sum(1 for agent in self.orchestrator.agents.values() if agent.infected)
         
         return jsonify({
@@ -1125,7 +1123,7 @@ HTML_TEMPLATE = """
                 updateAgents(agents, status.healing_in_progress || []);
                 updateHealings(healings);
                 updatePatterns(stats.learned_patterns);
-                updateHealingProgress(status.healing_in_progress || []);
+                updateHealingProgress(status.healing_in_progress || [], status.healing_stages || {});
                 updatePendingApprovals(pendingApprovals);
                 const rejectedApprovals = await fetch('/api/rejected-approvals').then(r => r.json());
                 updateRejectedApprovals(rejectedApprovals);
@@ -1134,14 +1132,14 @@ HTML_TEMPLATE = """
             }
         }
         
-        function updateHealingProgress(agentIds) {
+        function updateHealingProgress(agentIds, stages) {
             const banner = document.getElementById('healing-progress-banner');
             const el = document.getElementById('healing-progress-agents');
             if (agentIds.length === 0) {
                 banner.style.display = 'none';
                 return;
             }
-            el.textContent = agentIds.join(', ');
+            el.textContent = agentIds.map(id => stages[id] ? `${id} (${stages[id].replace('_', ' ')})` : id).join(', ');
             banner.style.display = 'block';
         }
         
@@ -12,6 +12,7 @@ A system that treats AI agents as living entities with an immune system that:
 import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from immune_system.agents import create_agent_pool
 from immune_system.orchestrator import ImmuneSystemOrchestrator
 from immune_system.web_dashboard import WebDashboard
@@ -27,6 +28,8 @@ from opentelemetry.sdk.resources import Resource
 
 logger = get_logger(__name__)
 
+EXECUTOR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
 
 def configure_otel():
     """Configure OTEL metrics export when OTLP endpoint is available."""
@@ -63,6 +66,10 @@ def _check_influx_health(store: InfluxStore) -> bool:
 
 async def main():
     """Main entry point with web dashboard"""
+    # Bounded pool for run_in_executor / DNS offloads; nothing hot runs in
+    # threads, so asyncio's min(32, cpus + 4) default is oversized.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="immune"))
     setup_logging()
     configure_otel()
 
@@ -124,7 +131,17 @@ async def main():
         cache.shutdown()
 
 
+def _install_uvloop():
+    """Use uvloop's libuv-backed event loop when it is installed (optional)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,202 @@
+"""Tests for the simulated agent runtime: telemetry generation and infection effects."""
+import asyncio
+import sys
+
+from immune_system.agents import (
+    AGENT_NAMES, MCP_SERVER_PRESETS, MODEL_COST_PER_1K, MODELS, BaseAgent, DataAgent, InfectionType,
+    ResearchAgent, create_agent_pool, execute_all,
+)
+from immune_system.telemetry import AgentVitals
+
+
+class TestExecuteBatch:
+    def test_one_vitals_record_per_agent_in_order(self):
+        agents = create_agent_pool(6)
+        out = BaseAgent.execute_batch(agents)
+        assert [v.agent_id for v in out] == [a.agent_id for a in agents]
+        assert all(isinstance(v, AgentVitals) for v in out)
+
+    def test_record_fields_are_populated(self):
+        agent = DataAgent("d1", model_name="GPT-4")
+        v = BaseAgent.execute_batch([agent])[0]
+        assert v.agent_type == "Data"
+        assert v.model == "GPT-4"
+        assert v.token_count == v.input_tokens + v.output_tokens
+        assert v.cost == agent._estimate_cost(v.token_count)
+        assert v.timestamp > 0
+
+    def test_reassigned_model_name_updates_cost(self):
+        agent = DataAgent("d1", model_name="GPT-4o")
+        agent.model_name = "GPT-5"
+        v = BaseAgent.execute_batch([agent])[0]
+        assert v.model == "GPT-5"
+        assert v.cost == round(v.token_count * MODEL_COST_PER_1K["GPT-5"] / 1000.0, 6)
+
+    def test_increments_execution_count(self):
+        agents = create_agent_pool(3)
+        BaseAgent.execute_batch(agents)
+        BaseAgent.execute_batch(agents)
+        assert all(a.execution_count == 2 for a in agents)
+
+    def test_healthy_vitals_stay_near_baseline(self):
+        agent = BaseAgent("a1", "test")
+        for v in BaseAgent.execute_batch([agent] * 50):
+            assert v.token_count <= int(agent.base_tokens * 1.2)
+            assert v.latency_ms <= int(agent.base_latency_ms * 1.2)
+            assert v.tool_calls >= 1
+            assert v.error_type == ""
+            assert v.prompt_hash == agent._prompt_hash
+
+    def test_infected_agent_inflates_metrics(self):
+        healthy = BaseAgent("h1", "test")
+        infected = BaseAgent("i1", "test")
+        infected.infect("full_meltdown")
+        h, i = BaseAgent.execute_batch([healthy, infected])
+        assert i.latency_ms >= infected.base_latency_ms * 3
+        assert i.tool_calls >= infected.base_tool_calls * 5
+        assert h.error_type == ""
+
+    def test_empty_batch(self):
+        assert BaseAgent.execute_batch([]) == []
+
+
+class TestExecute:
+    def test_execute_matches_batch_schema(self):
+        agent = BaseAgent("a1", "test")
+        vitals = asyncio.run(agent.execute())
+        assert isinstance(vitals, AgentVitals)
+        assert vitals.agent_id == "a1"
+        assert agent.execution_count == 1
+
+
+class _IOAgent(BaseAgent):
+    """Agent with a custom (awaiting) execute, like a real I/O-backed agent."""
+
+    async def execute(self):
+        await asyncio.sleep(0)
+        vitals = self._compute_telemetry()
+        vitals.error_type = "custom"
+        return vitals
+
+
+class TestExecuteAll:
+    def test_preserves_input_order_across_paths(self):
+        agents = [BaseAgent("s1", "test"), _IOAgent("c1", "test"), BaseAgent("s2", "test")]
+        out = asyncio.run(execute_all(agents))
+        assert [v.agent_id for v in out] == ["s1", "c1", "s2"]
+        assert out[1].error_type == "custom"
+        assert out[0].error_type == ""
+
+    def test_simulated_agents_use_batch(self, monkeypatch):
+        calls = []
+        original = BaseAgent.execute_batch.__func__
+
+        def spy(cls, agents):
+            calls.append(len(agents))
+            return original(cls, agents)
+
+        monkeypatch.setattr(BaseAgent, "execute_batch", classmethod(spy))
+        asyncio.run(execute_all(create_agent_pool(5)))
+        assert calls == [5]
+
+    def test_empty(self):
+        assert asyncio.run(execute_all([])) == []
+
+
+class TestInfectionProfiles:
+    def test_infect_maps_name_to_type_id(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("tool_loop")
+        assert agent.infection_type_id == InfectionType.TOOL_LOOP
+        assert agent.infection_type == "tool_loop"
+
+    def test_infect_accepts_enum(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect(InfectionType.LATENCY_SPIKE)
+        assert agent.infection_type == "latency_spike"
+        assert agent.infected
+
+    def test_unknown_infection_leaves_vitals_at_baseline(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("something_new")
+        assert agent.infection_type_id == InfectionType.NONE
+        latency, _, _, tools, _, error_type, prompt_hash = agent._infected_vitals()
+        assert latency == agent.base_latency_ms
+        assert tools == agent.base_tool_calls
+        assert error_type == ""
+        assert prompt_hash == agent._prompt_hash
+
+    def test_tool_loop_only_inflates_tools(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("tool_loop")
+        latency, _, _, tools, _, _, _ = agent._infected_vitals()
+        assert latency == agent.base_latency_ms
+        assert agent.base_tool_calls * 5 <= tools <= agent.base_tool_calls * 11
+
+    def test_prompt_drift_changes_prompt_hash(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("prompt_drift")
+        *_, prompt_hash = agent._infected_vitals()
+        assert prompt_hash != agent._prompt_hash
+
+    def test_infection_type_is_interned(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("".join(["tool", "_loop"]))
+        assert agent.infection_type is sys.intern("tool_loop")
+
+    def test_non_string_labels_are_not_interned(self):
+        agent = BaseAgent("a1", None)
+        assert agent.agent_type is None
+        assert BaseAgent("a2", 7).agent_type == 7
+
+    def test_cure_resets_type_id(self):
+        agent = BaseAgent("a1", "test")
+        agent.infect("full_meltdown")
+        agent.cure()
+        assert agent.infection_type_id == InfectionType.NONE
+        assert not agent.infected
+
+
+class TestCreateAgentPool:
+    def test_round_robin_assignment(self):
+        agents = create_agent_pool(len(AGENT_NAMES) + 2)
+        assert len(agents) == len(AGENT_NAMES) + 2
+        assert [a.agent_id for a in agents[:3]] == list(AGENT_NAMES[:3])
+        assert agents[len(AGENT_NAMES)].agent_id == AGENT_NAMES[0]
+        assert isinstance(agents[0], ResearchAgent)
+        assert isinstance(agents[1], DataAgent)
+        assert agents[len(MODELS)].model_name == MODELS[0]
+        assert agents[1].mcp_servers == list(MCP_SERVER_PRESETS[1])
+
+    def test_mcp_server_lists_are_not_shared(self):
+        a, b = create_agent_pool(len(MCP_SERVER_PRESETS) + 1)[::len(MCP_SERVER_PRESETS)]
+        a.mcp_servers.append("extra")
+        assert b.mcp_servers == list(MCP_SERVER_PRESETS[0])
+
+    def test_zero_count(self):
+        assert create_agent_pool(0) == []
+
+    def test_seed_makes_baselines_reproducible(self):
+        def baselines(pool):
+            return [(a.base_latency_ms, a.base_tokens, a.base_tool_calls) for a in pool]
+        assert baselines(create_agent_pool(8, seed=7)) == baselines(create_agent_pool(8, seed=7))
+
+    def test_baselines_drawn_from_subclass_ranges(self):
+        for agent in create_agent_pool(40):
+            cls = type(agent)
+            assert cls.LATENCY_RANGE_MS[0] <= agent.base_latency_ms <= cls.LATENCY_RANGE_MS[1]
+            assert cls.TOKENS_RANGE[0] <= agent.base_tokens <= cls.TOKENS_RANGE[1]
+            assert cls.TOOL_CALLS_RANGE[0] <= agent.base_tool_calls <= cls.TOOL_CALLS_RANGE[1]
+
+
+class TestBaselineOverrides:
+    def test_explicit_baselines_are_kept(self):
+        agent = DataAgent("d1", base_latency_ms=123, base_tokens=456, base_tool_calls=7)
+        assert (agent.base_latency_ms, agent.base_tokens, agent.base_tool_calls) == (123, 456, 7)
+        assert agent.agent_type == "Data"
+
+    def test_defaults_drawn_from_class_ranges(self):
+        agent = ResearchAgent("r1")
+        assert 1200 <= agent.base_tokens <= 1600
+        assert 3 <= agent.base_tool_calls <= 5
+        assert 200 <= agent.base_latency_ms <= 400
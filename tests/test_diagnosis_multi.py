@@ -167,6 +167,30 @@ class TestSuccessWeightedActionSelection:
         action = healer.get_next_action(DiagnosisType.PROMPT_DRIFT, all_actions)
         assert action is None
 
+    def test_action_plan_matches_successive_next_actions(self):
+        healer = Healer(None, None, None)
+        memory = ImmuneMemory()
+        memory.record_healing("x", DiagnosisType.PROMPT_DRIFT, HealingAction.RESET_AGENT, True)
+        memory.record_healing("y", DiagnosisType.PROMPT_DRIFT, HealingAction.ROLLBACK_PROMPT, True)
+        memory.record_healing("z", DiagnosisType.PROMPT_DRIFT, HealingAction.RESET_AGENT, True)
+        failed = {HealingAction.REDUCE_AUTONOMY}
+
+        plan = healer.get_action_plan(DiagnosisType.PROMPT_DRIFT, failed, memory)
+
+        picked = []
+        while True:
+            action = healer.get_next_action(DiagnosisType.PROMPT_DRIFT, failed | set(picked), memory)
+            if action is None:
+                break
+            picked.append(action)
+        assert plan == picked
+        assert plan == [HealingAction.RESET_AGENT, HealingAction.ROLLBACK_PROMPT, HealingAction.RESET_MEMORY]
+
+    def test_action_plan_empty_when_exhausted(self):
+        healer = Healer(None, None, None)
+        all_actions = set(HEALING_POLICIES[DiagnosisType.PROMPT_DRIFT])
+        assert healer.get_action_plan(DiagnosisType.PROMPT_DRIFT, all_actions, ImmuneMemory()) == []
+
     def test_external_cause_has_policy(self):
         healer = Healer(None, None, None)
         policy = healer.get_healing_policy(DiagnosisType.EXTERNAL_CAUSE)
@@ -0,0 +1,252 @@
+"""Tests for logging formatters and handler setup."""
+import io
+import json
+import logging
+import re
+import time
+
+from immune_system import logging_config
+from immune_system.logging_config import (
+    ColoredFormatter, FlushStreamHandler, JSONFormatter, _CachedTimeFormatter, _Colors, lazy,
+)
+
+
+def _record(level=logging.INFO, name="orchestrator", msg="agent %s healed", args=("a1",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestColoredFormatter:
+    def test_plain_output_without_color(self):
+        out = ColoredFormatter(use_color=False).format(_record())
+        assert "\033[" not in out
+        assert "INFO" in out and "orchestrator" in out
+        assert out.endswith("agent a1 healed")
+
+    def test_level_color_applied(self):
+        fmt = ColoredFormatter(use_color=True)
+        assert _Colors.YELLOW in fmt.format(_record(level=logging.WARNING))
+        assert _Colors.GREEN in fmt.format(_record(level=logging.INFO))
+        assert _Colors.CYAN + "orchestrator" in fmt.format(_record())
+
+    def test_record_not_mutated(self):
+        record = _record(level=logging.ERROR)
+        ColoredFormatter(use_color=True).format(record)
+        assert record.levelname == "ERROR"
+        assert record.name == "orchestrator"
+
+    def test_custom_level_uses_fallback(self):
+        out = ColoredFormatter(use_color=True).format(_record(level=25))
+        assert "Level 25" in out
+        assert out.endswith("agent a1 healed")
+
+
+class TestJSONFormatter:
+    def test_fields(self):
+        entry = json.loads(JSONFormatter().format(_record(level=logging.WARNING)))
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "orchestrator"
+        assert entry["message"] == "agent a1 healed"
+        assert "timestamp" in entry
+
+    def test_structured_data_non_serializable_values_stringified(self):
+        record = _record()
+        record.structured_data = {"agent": object(), 1: "int-key"}
+        entry = json.loads(JSONFormatter().format(record))
+        assert entry["data"]["agent"].startswith("<object")
+        assert entry["data"]["1"] == "int-key"
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(logging_config, "_orjson", None)
+        record = _record()
+        record.structured_data = {"agent": object()}
+        entry = json.loads(JSONFormatter().format(record))
+        assert entry["message"] == "agent a1 healed"
+        assert entry["data"]["agent"].startswith("<object")
+
+    def test_big_int_falls_back_to_stdlib(self):
+        record = _record()
+        record.structured_data = {"tokens": 2 ** 70}
+        entry = json.loads(JSONFormatter().format(record))
+        assert entry["data"]["tokens"] == 2 ** 70
+
+    def test_timestamp_has_microseconds(self):
+        record = _record()
+        record.created = 1700000000.25
+        entry = json.loads(JSONFormatter().format(record))
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.250000", entry["timestamp"])
+
+
+class TestCachedTime:
+    def _records_at(self, *created):
+        records = []
+        for ts in created:
+            record = _record()
+            record.created = ts
+            record.msecs = (ts % 1) * 1000
+            records.append(record)
+        return records
+
+    def test_strftime_once_per_second(self, monkeypatch):
+        calls = []
+        real_strftime = time.strftime
+        monkeypatch.setattr(logging_config.time, "strftime", lambda *a: calls.append(a) or real_strftime(*a))
+        fmt = ColoredFormatter(use_color=False)
+        outs = [fmt.formatTime(r, fmt.datefmt) for r in self._records_at(100.1, 100.5, 100.9, 101.0)]
+        assert len(calls) == 2
+        assert outs[0] == outs[1] == outs[2] != outs[3]
+
+    def test_matches_stdlib_output(self):
+        for record in self._records_at(1700000000.123, 1700000000.987, 1700000001.5):
+            for datefmt in (None, ColoredFormatter.DATEFMT):
+                expected = logging.Formatter(datefmt=datefmt).formatTime(record, datefmt)
+                assert _CachedTimeFormatter(datefmt=datefmt).formatTime(record, datefmt) == expected
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestFlushStreamHandler:
+    def _handler(self):
+        stream = _CountingStream()
+        handler = FlushStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.FLUSH_INTERVAL_S = 3600.0
+        return handler, stream
+
+    def test_info_records_flushed_in_batches(self):
+        handler, stream = self._handler()
+        for _ in range(FlushStreamHandler.FLUSH_EVERY - 1):
+            handler.emit(_record())
+        assert stream.flushes == 0
+        handler.emit(_record())
+        assert stream.flushes == 1
+        assert stream.getvalue().count("\n") == FlushStreamHandler.FLUSH_EVERY
+
+    def test_warning_flushes_immediately(self):
+        handler, stream = self._handler()
+        handler.emit(_record())
+        handler.emit(_record(level=logging.WARNING))
+        assert stream.flushes == 1
+
+    def test_interval_elapsed_flushes(self):
+        handler, stream = self._handler()
+        handler.FLUSH_INTERVAL_S = 0.0
+        handler.emit(_record())
+        assert stream.flushes == 1
+
+    def test_idle_record_flushed_within_interval(self):
+        handler, stream = self._handler()
+        handler.FLUSH_INTERVAL_S = 0.05
+        handler.emit(_record())
+        assert stream.flushes == 0
+        deadline = time.monotonic() + 1.0
+        while stream.flushes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.flushes == 1
+        assert handler._pending == 0
+        handler.close()
+
+    def test_explicit_flush_writes_pending(self):
+        handler, stream = self._handler()
+        handler.emit(_record())
+        handler.flush()
+        assert stream.flushes == 1
+        assert handler._pending == 0
+
+
+class TestLazy:
+    def test_not_evaluated_when_level_disabled(self):
+        calls = []
+        logger = logging.getLogger("test.lazy.disabled")
+        logger.setLevel(logging.WARNING)
+        logger.info("value: %s", lazy(lambda: calls.append(1) or "x"))
+        assert calls == []
+
+    def test_evaluated_when_emitted(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        logger = logging.getLogger("test.lazy.enabled")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("pending: %s", lazy(", ".join, ["a1", "a2"]))
+        finally:
+            logger.removeHandler(handler)
+        assert stream.getvalue() == "pending: a1, a2\n"
+
+
+class TestQueuedSetup:
+    def _setup(self, monkeypatch, stream=None, **kwargs):
+        root = logging.getLogger()
+        saved = (root.handlers[:], root.level)
+        stream = stream if stream is not None else io.StringIO()
+        monkeypatch.setattr(logging_config.sys, "stdout", stream)
+        logging_config.setup_logging(level="INFO", log_format="text", **kwargs)
+
+        def restore():
+            logging_config._stop_queue_listener()
+            for handler in root.handlers:
+                if handler not in saved[0]:
+                    handler.close()
+            root.handlers[:], root.level = saved
+        return stream, restore
+
+    def test_records_written_by_listener(self, monkeypatch):
+        stream, restore = self._setup(monkeypatch, use_queue=True)
+        try:
+            assert isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+            pending = ["a1"]
+            logging.getLogger("test.queue").info("pending: %s", pending)
+            pending.append("a2")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("test.queue").exception("failed")
+            logging_config._stop_queue_listener()
+            out = stream.getvalue()
+            assert "pending: ['a1']" in out
+            assert "ValueError: boom" in out
+        finally:
+            restore()
+
+    def test_idle_queued_record_flushed(self, monkeypatch):
+        monkeypatch.setattr(FlushStreamHandler, "FLUSH_INTERVAL_S", 0.05)
+        stream, restore = self._setup(monkeypatch, stream=_CountingStream(), use_queue=True)
+        try:
+            logging.getLogger("test.queue").info("HEALING SUCCESS")
+            deadline = time.monotonic() + 1.0
+            while stream.flushes == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert stream.flushes >= 1
+            assert "HEALING SUCCESS" in stream.getvalue()
+        finally:
+            restore()
+
+    def test_reinit_closes_previous_handlers(self, monkeypatch):
+        stream, restore = self._setup(monkeypatch, use_queue=False)
+        try:
+            old = logging.getLogger().handlers[0]
+            logging.getLogger("test.queue").info("first")
+            logging_config.setup_logging(level="INFO", log_format="text", use_queue=False)
+            assert old not in logging.getLogger().handlers
+            assert old._closed
+            old._flusher.join(timeout=1.0)
+            assert not old._flusher.is_alive()
+            assert "first" in stream.getvalue()
+        finally:
+            restore()
+
+    def test_inline_when_disabled(self, monkeypatch):
+        stream, restore = self._setup(monkeypatch, use_queue=False)
+        try:
+            assert isinstance(logging.getLogger().handlers[0], FlushStreamHandler)
+            assert logging_config._queue_listener is None
+        finally:
+            restore()
@@ -11,10 +11,12 @@ import pytest
 
 from immune_system.agents import BaseAgent
 from immune_system.cache import CacheManager
+from immune_system import orchestrator as orchestrator_module
 from immune_system.orchestrator import ImmuneSystemOrchestrator, DEVIATION_REQUIRING_APPROVAL
 from immune_system.telemetry import AgentVitals, TelemetryCollector
 from immune_system.baseline import BaselineLearner
 from immune_system.detection import Sentinel, AnomalyType, InfectionReport
+from immune_system.lifecycle import AgentPhase
 
 
 # ---------------------------------------------------------------------------
@@ -225,6 +227,54 @@ class TestHITLApprovalFlow:
         assert not agent.infected
 
 
+class TestBulkApprovalFlow:
+    def _orch_with_pending(self, agent_ids):
+        agents = [BaseAgent(aid, "test") for aid in agent_ids]
+        orch = ImmuneSystemOrchestrator(agents)
+        for agent in agents:
+            _feed_normal_vitals(orch, agent, n=20)
+            infection = InfectionReport(
+                agent_id=agent.agent_id,
+                max_deviation=6.0,
+                anomalies=[AnomalyType.TOKEN_SPIKE],
+                deviations={"tokens": 6.0},
+            )
+            diag = orch.diagnostician.diagnose(infection, orch.baseline_learner.get_baseline(agent.agent_id))
+            orch._pending_approvals[agent.agent_id] = {
+                "infection": infection,
+                "diagnosis": diag,
+                "requested_at": time.time(),
+            }
+        return orch
+
+    def test_approve_all_returns_every_pending_infection(self):
+        orch = self._orch_with_pending(["a1", "a2", "a3"])
+        approved = orch.approve_all_pending(True)
+        assert [aid for aid, _ in approved] == ["a1", "a2", "a3"]
+        assert all(inf.agent_id == aid for aid, inf in approved)
+        assert orch.get_pending_approvals() == []
+        assert [a["type"] for a in orch.get_healing_actions()].count("user_approved") == 3
+
+    def test_reject_all_moves_to_rejected_and_heal_all_drains(self):
+        orch = self._orch_with_pending(["a1", "a2"])
+        assert orch.approve_all_pending(False) == []
+        assert orch.get_pending_approvals() == []
+        assert {r["agent_id"] for r in orch.get_rejected_approvals()} == {"a1", "a2"}
+
+        healed = orch.start_healing_all_rejected()
+        assert sorted(aid for aid, _ in healed) == ["a1", "a2"]
+        assert orch.get_rejected_approvals() == []
+        assert orch.start_healing_all_rejected() == []
+
+    def test_anomaly_names_frozen_on_entry(self):
+        orch = self._orch_with_pending(["a1"])
+        assert orch.get_pending_approvals()[0]["anomalies"] == ("token_spike",)
+        orch._pending_approvals["a1"]["anomalies"] = ("frozen",)
+        assert orch.get_pending_approvals()[0]["anomalies"] == ("frozen",)
+        orch.approve_healing("a1", False)
+        assert orch.get_rejected_approvals()[0]["anomalies"] == ("frozen",)
+
+
 class TestAutoHealFlow:
     @pytest.mark.asyncio
     async def test_auto_heal_releases_quarantine(self):
@@ -244,6 +294,217 @@ class TestAutoHealFlow:
         await orch.heal_agent("a1", infection)
         # After healing, the agent should be released
         assert not orch.quarantine.is_quarantined("a1")
+        assert orch.get_healing_stages() == {}
+
+    @pytest.mark.asyncio
+    async def test_healing_stage_published_while_healing(self):
+        agent = BaseAgent("a1", "test")
+        orch = ImmuneSystemOrchestrator([agent])
+        _feed_normal_vitals(orch, agent, n=20)
+        infection = InfectionReport(
+            agent_id="a1",
+            max_deviation=3.0,
+            anomalies=[AnomalyType.LATENCY_SPIKE],
+            deviations={"latency": 3.0},
+        )
+        orch.quarantine.quarantine("a1")
+        agent.quarantine()
+
+        task = asyncio.create_task(orch.heal_agent("a1", infection))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # No fixed step delays: the first action is applied straight away and
+        # the agent is already waiting out probation.
+        assert orch.get_healing_stages() == {"a1": "probation"}
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert orch.get_healing_stages() == {}
+        assert "a1" not in orch.healing_in_progress
+
+    @pytest.mark.asyncio
+    async def test_drained_event_follows_healing_in_progress(self):
+        agent = BaseAgent("a1", "test")
+        orch = ImmuneSystemOrchestrator([agent])
+        _feed_normal_vitals(orch, agent, n=20)
+        infection = InfectionReport(
+            agent_id="a1",
+            max_deviation=3.0,
+            anomalies=[AnomalyType.LATENCY_SPIKE],
+            deviations={"latency": 3.0},
+        )
+        orch._drained = asyncio.Event()
+        orch._drained.set()
+
+        task = asyncio.create_task(orch.heal_agent("a1", infection))
+        await asyncio.sleep(0)
+        assert not orch._drained.is_set()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert orch._drained.is_set()
+
+
+class TestDrainFanOut:
+    @pytest.mark.asyncio
+    async def test_heal_all_heals_every_job(self):
+        agents = [BaseAgent("a1", "test"), BaseAgent("a2", "test")]
+        orch = ImmuneSystemOrchestrator(agents)
+        calls = []
+
+        async def fake_heal(agent_id, infection, trigger="auto", context=None):
+            await asyncio.sleep(0)
+            calls.append((agent_id, trigger))
+
+        orch.heal_agent = fake_heal
+        await orch._heal_all([("a1", None, "drain_approve"), ("a2", None, "drain_heal_now")])
+        assert sorted(calls) == [("a1", "drain_approve"), ("a2", "drain_heal_now")]
+
+    @pytest.mark.asyncio
+    async def test_heal_all_survives_one_failing_heal(self):
+        orch = ImmuneSystemOrchestrator([BaseAgent("a1", "test"), BaseAgent("a2", "test")])
+        calls = []
+
+        async def fake_heal(agent_id, infection, trigger="auto", context=None):
+            if agent_id == "a1":
+                raise RuntimeError("heal failed")
+            await asyncio.sleep(0.01)
+            calls.append(agent_id)
+
+        orch.heal_agent = fake_heal
+        await orch._heal_all([("a1", None, "drain_approve"), ("a2", None, "drain_approve")])
+        assert calls == ["a2"]
+
+    @pytest.mark.asyncio
+    async def test_heal_all_empty(self):
+        await ImmuneSystemOrchestrator([])._heal_all([])
+
+
+class TestChaosSchedule:
+    @pytest.fixture(autouse=True)
+    def _fast_waves(self, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "CHAOS_WAVES", ((0.01, 1), (0.02, 1)))
+
+    @pytest.mark.asyncio
+    async def test_waves_fire_on_timers(self):
+        agents = [BaseAgent(f"a{i}", "test") for i in range(3)]
+        orch = ImmuneSystemOrchestrator(agents)
+        handles = orch.chaos_injection_schedule(duration_seconds=60)
+        assert len(handles) == 2
+        await asyncio.sleep(0.05)
+        assert sum(a.infected for a in agents) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_injection_past_cutoff_or_after_cancel(self):
+        agents = [BaseAgent("a1", "test"), BaseAgent("a2", "test")]
+        orch = ImmuneSystemOrchestrator(agents)
+        orch.chaos_injection_schedule(duration_seconds=0)
+        for handle in ImmuneSystemOrchestrator(agents).chaos_injection_schedule(duration_seconds=60):
+            handle.cancel()
+        await asyncio.sleep(0.05)
+        assert not any(a.infected for a in agents)
+
+
+class TestRunCleanup:
+    @staticmethod
+    def _quick_orch():
+        orch = ImmuneSystemOrchestrator([])
+
+        async def idle():
+            return None
+
+        orch.sentinel_loop = idle
+        return orch
+
+    @pytest.mark.asyncio
+    async def test_task_factory_restored_when_drain_raises(self):
+        orch = self._quick_orch()
+        loop = asyncio.get_running_loop()
+        previous = loop.get_task_factory()
+
+        async def failing_heal_all(jobs):
+            raise RuntimeError("drain failed")
+
+        orch._heal_all = failing_heal_all
+        before = asyncio.all_tasks()
+        with pytest.raises(RuntimeError):
+            await orch.run(duration_seconds=0)
+        assert loop.get_task_factory() is previous
+        assert not orch.running
+        await asyncio.sleep(0)
+        assert asyncio.all_tasks() <= before
+
+
+class TestRegisterAgent:
+    def test_register_adds_to_sentinel_snapshot(self):
+        orch = ImmuneSystemOrchestrator([BaseAgent("a1", "test")])
+        agent = BaseAgent("ext1", "external")
+        assert orch.register_agent(agent)
+        assert orch.agents["ext1"] is agent
+        assert [aid for aid, _ in orch._agents_items] == ["a1", "ext1"]
+
+    def test_register_existing_id_is_noop(self):
+        original = BaseAgent("a1", "test")
+        orch = ImmuneSystemOrchestrator([original])
+        assert not orch.register_agent(BaseAgent("a1", "other"))
+        assert orch.agents["a1"] is original
+        assert len(orch._agents_items) == 1
+
+
+class TestTickLoop:
+    async def _run_ticks(self, orch, agents, duration=0.05):
+        task = asyncio.create_task(orch.tick_loop(agents))
+        await asyncio.sleep(duration)
+        orch.running = False
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_one_execution_per_agent_per_tick(self):
+        agents = [BaseAgent(f"a{i}", "test") for i in range(3)]
+        orch = ImmuneSystemOrchestrator(agents)
+        await self._run_ticks(orch, agents)
+        assert [orch.telemetry.get_count(a.agent_id) for a in agents] == [1, 1, 1]
+        assert all(a.execution_count == 1 for a in agents)
+
+    @pytest.mark.asyncio
+    async def test_blocked_agents_skipped(self):
+        agents = [BaseAgent("a1", "test"), BaseAgent("a2", "test")]
+        orch = ImmuneSystemOrchestrator(agents)
+        for phase in (AgentPhase.HEALTHY, AgentPhase.DRAINING):
+            orch.lifecycle.transition("a2", phase, "test")
+        await self._run_ticks(orch, agents)
+        assert orch.telemetry.get_count("a1") == 1
+        assert orch.telemetry.get_count("a2") == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_record_does_not_stop_other_agents(self, monkeypatch):
+        agents = [BaseAgent(f"a{i}", "test") for i in range(4)]
+        orch = ImmuneSystemOrchestrator(agents)
+        monkeypatch.setattr(orchestrator_module, "TICK_INTERVAL_SECONDS", 0.01)
+        real_record = orch.telemetry.record
+        failures = []
+
+        def flaky_record(vitals):
+            if vitals.agent_id == "a3" and not failures:
+                failures.append(vitals.agent_id)
+                raise RuntimeError("store unavailable")
+            return real_record(vitals)
+
+        monkeypatch.setattr(orch.telemetry, "record", flaky_record)
+        await self._run_ticks(orch, agents, duration=0.1)
+        assert failures == ["a3"]
+        assert all(orch.telemetry.get_count(a.agent_id) >= 3 for a in agents[:3])
+        assert orch.telemetry.get_count("a3") >= 2
+
+    @pytest.mark.asyncio
+    async def test_baseline_ready_marks_agent_healthy(self):
+        agent = BaseAgent("a1", "test")
+        orch = ImmuneSystemOrchestrator([agent])
+        _feed_normal_vitals(orch, agent, n=20)
+        await self._run_ticks(orch, [agent])
+        assert orch.lifecycle.get_phase("a1") == AgentPhase.HEALTHY
 
 
 class TestDeviationThresholdSplit:
@@ -261,3 +522,18 @@ class TestStatistics:
         _feed_normal_vitals(orch, agent, n=20)
         assert orch.total_infections == 0
         assert orch.total_healed == 0
+
+    def test_action_log_bounded_and_returns_latest(self):
+        orch = ImmuneSystemOrchestrator([])
+        for i in range(100):
+            orch._log_action("probation_passed", f"a{i}")
+        actions = orch.get_healing_actions()
+        assert len(actions) == 50
+        assert actions[0]["agent_id"] == "a50"
+        assert actions[-1]["agent_id"] == "a99"
+        assert len(orch._healing_action_log) == orch._action_log_max
+
+    def test_runtime_ignores_wall_clock_jumps(self, monkeypatch):
+        orch = ImmuneSystemOrchestrator([])
+        monkeypatch.setattr(time, "time", lambda: orch.start_time - 3600)
+        assert 0 <= orch.get_runtime() < 60
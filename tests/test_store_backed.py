@@ -64,6 +64,15 @@ class TestStoreBackedDetection:
         assert infection is not None
         assert AnomalyType.LATENCY_SPIKE in infection.anomalies
 
+    def test_agent_vitals_converted_to_dict_for_store(self):
+        store = InMemoryStore(run_id="run-x")
+        telemetry = TelemetryCollector(store=store)
+        vitals = BaseAgent.execute_batch([BaseAgent("a1", "test")])[0]
+        assert telemetry.record(vitals) is vitals
+        rows = store.get_recent_agent_vitals("a1", window_seconds=60)
+        assert len(rows) == 1
+        assert AgentVitals(**rows[0]) == vitals
+
 
 class TestRunIdIsolation:
     """Data written with one run_id is not visible to a store with another run_id."""
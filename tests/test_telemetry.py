@@ -53,6 +53,18 @@ class TestRecord:
         v = tc.get_latest("a1")
         assert v.token_count == 110
 
+    def test_record_returns_normalised_vitals(self):
+        tc = TelemetryCollector()
+        v = tc.record(_vitals_dict())
+        assert isinstance(v, AgentVitals)
+        assert tc.get_latest("a1") is v
+
+    def test_record_accepts_agent_vitals_as_is(self):
+        tc = TelemetryCollector()
+        v = AgentVitals(**_vitals_dict())
+        assert tc.record(v) is v
+        assert tc.get_latest("a1") is v
+
 
 class TestBoundedBuffer:
     def test_deque_maxlen(self):
@@ -76,6 +88,21 @@ class TestGetRecent:
         tc = TelemetryCollector()
         assert tc.get_recent("unknown") == []
 
+    def test_returns_samples_oldest_first(self):
+        tc = TelemetryCollector()
+        now = time.time()
+        for offset in (30, 8, 4, 0):
+            tc.record(_vitals_dict(timestamp=now - offset, latency_ms=offset))
+        assert [v.latency_ms for v in tc.get_recent("a1", window_seconds=10)] == [8, 4, 0]
+
+    def test_out_of_order_samples_still_found(self):
+        tc = TelemetryCollector()
+        now = time.time()
+        tc.record(_vitals_dict(timestamp=now - 2, latency_ms=1))
+        tc.record(_vitals_dict(timestamp=now - 60, latency_ms=2))  # late external sample
+        tc.record(_vitals_dict(timestamp=now, latency_ms=3))
+        assert [v.latency_ms for v in tc.get_recent("a1", window_seconds=10)] == [1, 3]
+
 
 class TestGetLatest:
     def test_returns_most_recent(self):
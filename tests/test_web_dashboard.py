@@ -34,6 +34,12 @@ class TestReadOnlyEndpoints:
         data = r.get_json()
         assert "running" in data
         assert "baselines_learned" in data
+        assert data["healing_stages"] == {}
+
+    def test_get_status_reports_healing_stage(self, client, orchestrator_with_one_agent):
+        orchestrator_with_one_agent._set_healing_stage("test-agent", "applying")
+        data = client.get("/api/status").get_json()
+        assert data["healing_stages"] == {"test-agent": "applying"}
 
     def test_get_agents(self, client):
         r = client.get("/api/agents")
@@ -87,6 +93,24 @@ class TestIngest:
         # Telemetry should have been recorded (in-memory or store)
         assert orchestrator_with_one_agent.telemetry.get_count("external-1") >= 1
 
+    def test_ingest_non_string_agent_type_accepted(self, client, orchestrator_with_one_agent):
+        r = client.post(
+            "/api/v1/ingest",
+            json={"agent_id": "external-2", "agent_type": None, "latency_ms": 100},
+            content_type="application/json",
+        )
+        assert r.status_code == 200
+        assert "external-2" in orchestrator_with_one_agent.agents
+
+    def test_register_non_string_agent_type_accepted(self, client, orchestrator_with_one_agent):
+        r = client.post(
+            "/api/v1/agents/register",
+            json={"agent_id": "external-3", "agent_type": 7},
+            content_type="application/json",
+        )
+        assert r.status_code == 200
+        assert r.get_json()["status"] == "registered"
+
     def test_ingest_missing_agent_id_returns_400(self, client):
         r = client.post(
             "/api/v1/ingest",